@@ -1,7 +1,10 @@
 """Remote extractor fetching with local caching."""
 
+import os
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -11,38 +14,105 @@ CACHE_DIR = Path.home() / ".job_search" / "extractors"
 CACHE_TTL = 3600  # 1 hour
 
 
+# Stale entries are refreshed here while callers keep using the cached copy
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extractor-refresh")
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+# In-process tier over the disk cache: cache file -> (monotonic time fetched, JS).
+# Fresh hits skip the stat() and read entirely.
+_mem_cache: dict[Path, tuple[float, str]] = {}
+
+# Cold-cache fetches in progress; concurrent callers wait on the same one
+_inflight: dict[Path, Future] = {}
+_inflight_lock = threading.Lock()
+
+
 def get_extractor_js(source: str) -> str:
     """Fetch extractor JS from GitHub with caching.
 
     Returns the JS code for the given source (e.g., "glassdoor").
-    Uses local cache if fresh (<1 hour), otherwise fetches from GitHub.
-    Falls back to stale cache if network fails.
+    Any cached copy is returned immediately; if it is older than an hour a
+    background refresh is started (stale-while-revalidate). Only blocks on
+    the network when nothing is cached yet.
     """
     cache_file = CACHE_DIR / f"{source}.js"
 
-    # Check cache
-    if cache_file.exists():
-        age = time.time() - cache_file.stat().st_mtime
-        if age < CACHE_TTL:
-            return cache_file.read_text()
+    hit = _mem_cache.get(cache_file)
+    if hit and time.monotonic() - hit[0] < CACHE_TTL:
+        return hit[1]
 
-    # Fetch from GitHub
-    url = f"{GITHUB_RAW_BASE}/{source}.js"
+    # Check disk cache
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        js_code = resp.text
+        mtime = cache_file.stat().st_mtime
+    except FileNotFoundError:
+        pass
+    else:
+        js_code = cache_file.read_text()
+        age = time.time() - mtime
+        if age >= CACHE_TTL:
+            _refresh_in_background(source, cache_file)
+        else:
+            # Remember when the disk copy was fetched so the TTL still applies
+            _mem_cache[cache_file] = (time.monotonic() - age, js_code)
+        return js_code
 
-        # Cache it
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(js_code)
+    with _inflight_lock:
+        future = _inflight.get(cache_file)
+        owner = future is None
+        if owner:
+            future = _inflight[cache_file] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        js_code = _fetch(source, cache_file)
+    except Exception as e:
+        error = RuntimeError(f"Cannot fetch {source} extractor: {e}")
+        future.set_exception(error)
+        raise error
+    else:
+        future.set_result(js_code)
         return js_code
+    finally:
+        with _inflight_lock:
+            del _inflight[cache_file]
+
+
+def _fetch(source: str, cache_file: Path) -> str:
+    """Download an extractor from GitHub and cache it."""
+    url = f"{GITHUB_RAW_BASE}/{source}.js"
+    resp = requests.get(url, timeout=10)
+    resp.raise_for_status()
+    js_code = resp.text
+
+    # Cache it (replace atomically so concurrent readers never see a partial file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(".js.tmp")
+    tmp.write_text(js_code)
+    os.replace(tmp, cache_file)
+    _mem_cache[cache_file] = (time.monotonic(), js_code)
+    return js_code
+
+
+def _refresh_in_background(source: str, cache_file: Path) -> None:
+    """Queue one refresh per source; callers arriving meanwhile don't add more."""
+    with _refreshing_lock:
+        if source in _refreshing:
+            return
+        _refreshing.add(source)
+    _REFRESH_EXECUTOR.submit(_refresh, source, cache_file)
+
+
+def _refresh(source: str, cache_file: Path) -> None:
+    try:
+        _fetch(source, cache_file)
     except Exception as e:
-        # Fall back to cache even if stale
-        if cache_file.exists():
-            print(f"Network error, using cached {source} extractor", file=sys.stderr)
-            return cache_file.read_text()
-        raise RuntimeError(f"Cannot fetch {source} extractor: {e}")
+        # Keep serving the stale copy; the next call past the TTL retries
+        print(f"Network error, using cached {source} extractor: {e}", file=sys.stderr)
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(source)
 
 
 def clear_cache(source: str | None = None) -> None:
@@ -50,13 +120,18 @@ def clear_cache(source: str | None = None) -> None:
 
     If source is None, clears all cached extractors.
     """
-    if not CACHE_DIR.exists():
-        return
-
     if source:
         cache_file = CACHE_DIR / f"{source}.js"
-        if cache_file.exists():
-            cache_file.unlink()
-    else:
-        for f in CACHE_DIR.glob("*.js"):
-            f.unlink()
+        _mem_cache.pop(cache_file, None)
+        cache_file.unlink(missing_ok=True)
+        return
+
+    _mem_cache.clear()
+
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".js"):
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        return
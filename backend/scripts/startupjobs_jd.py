@@ -2,6 +2,7 @@
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from bs4 import BeautifulSoup
@@ -10,6 +11,7 @@ from scripts.scrape_utils import html_to_md, now_iso
 
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
 API_URL = "https://core.startupjobs.cz/api/search/offers"
+MAX_CONCURRENT_SCRAPES = 5  # Parallel page fetches in scrape_jds
 
 
 def _extract_job_id(job_id_or_url: str) -> str:
@@ -122,11 +124,18 @@ def scrape_jds(job_ids: list[str], url_map: dict[str, str] | None = None) -> dic
     url_map = url_map or {}
     results, succeeded, failed = [], 0, 0
 
-    for job_id in job_ids:
+    def scrape_one(job_id: str) -> dict:
         # Normalize to get consistent key
         normalized = f"job_sj_{_extract_job_id(job_id)}" if not job_id.startswith("job_sj_") else job_id
         url = url_map.get(normalized) or url_map.get(job_id)
-        result = scrape_jd(job_id, url=url)
+        return scrape_jd(job_id, url=url)
+
+    # Plain HTTP fetches are independent, so run a bounded number at once
+    # (map keeps results in request order)
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_SCRAPES, len(job_ids))) as pool:
+        scraped = list(pool.map(scrape_one, job_ids))
+
+    for job_id, result in zip(job_ids, scraped):
         if result.get("status") == "ok":
             results.append({
                 "job_id": result["job_id"],
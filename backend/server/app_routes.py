@@ -1,5 +1,6 @@
 """API routes for application preparation - Step 3."""
 
+from dataclasses import asdict
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException
@@ -141,7 +142,7 @@ def get_applications(include_archived: bool = False, slim: bool = False):
             "total": len(apps),
         }
 
-    return {"applications": [a.model_dump() for a in apps]}
+    return {"applications": [asdict(a) for a in apps]}
 
 
 @router.get("/{application_id}")
@@ -1,20 +1,49 @@
 """Data layer for application preparation - Step 3."""
 
+import fcntl
+import hashlib
 import json
+import os
 import re
 import shutil
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from pydantic.dataclasses import dataclass
+from pydantic_core import to_json
 
 from server.docx_export import markdown_to_docx
 
 
+M = TypeVar("M", bound=BaseModel)
+
 APPLICATIONS_DIR = Path(__file__).parent.parent / "applications"
 APPLICATIONS_DIR.mkdir(exist_ok=True)
 
+# Summary index for list_applications: {application_id: summary fields}, kept
+# in APPLICATIONS_DIR (resolved at use time, so tests can point it elsewhere).
+# Names starting with "_" or "." there are never applications.
+_INDEX_NAME = "_index.json"
+_INDEX_LOCK_NAME = ".index.lock"
+
+# DOCX generation runs off the request path. A single worker keeps saves in
+# submission order, so an older save can never overwrite a newer cv.docx.
+_DOCX_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docx")
+
+# Serializes metadata read-modify-writes between request threads and the
+# DOCX worker, which records content hashes after each render.
+_METADATA_LOCK = threading.Lock()
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
 
 # --- Pydantic Models ---
 
@@ -77,13 +106,11 @@ class ApplicationMetadata(BaseModel):
     status: str = "pending"  # pending, scraping, generating, complete, error
     error: Optional[str] = None
     archived: bool = False
-    created_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
-    updated_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    created_at: str = Field(default_factory=_utc_now_iso)
+    updated_at: str = Field(default_factory=_utc_now_iso)
     versions: list[str] = Field(default_factory=list)
+    cv_docx_hash: Optional[str] = None
+    cover_docx_hash: Optional[str] = None
 
 
 class Application(BaseModel):
@@ -98,15 +125,13 @@ class Application(BaseModel):
     salary_research: Optional[SalaryResearch] = None
     referral_search: Optional[ReferralSearch] = None
     follow_up: Optional[FollowUp] = None
-    created_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
-    updated_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    created_at: str = Field(default_factory=_utc_now_iso)
+    updated_at: str = Field(default_factory=_utc_now_iso)
 
 
-class ApplicationSummary(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ApplicationSummary:
+    """Flat, read-only row for list_applications (no per-instance __dict__)."""
     application_id: str
     job_id: str
     job_title: str
@@ -149,15 +174,17 @@ def create_application(job: JobSummary) -> Application:
     application_id = _generate_application_id(job.company, job.title)
     app_dir = _get_app_dir(application_id)
 
-    # Handle duplicate IDs by appending counter
-    counter = 1
+    # Handle duplicate IDs by appending counter; mkdir both probes and claims
+    counter = 0
     original_id = application_id
-    while app_dir.exists():
-        application_id = f"{original_id}-{counter}"
-        app_dir = _get_app_dir(application_id)
-        counter += 1
-
-    app_dir.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            app_dir.mkdir(parents=True, exist_ok=False)
+            break
+        except FileExistsError:
+            counter += 1
+            application_id = f"{original_id}-{counter}"
+            app_dir = _get_app_dir(application_id)
 
     # Create metadata
     metadata = ApplicationMetadata(
@@ -184,28 +211,19 @@ def get_application(application_id: str) -> Optional[Application]:
     if not metadata:
         return None
 
-    # Load optional files
-    jd = _read_file(app_dir / "jd.md")
-    gap_analysis = _read_json(app_dir / "gap-analysis.json")
-    cv_tailored = _read_file(app_dir / "cv-tailored.md")
-    cover_letter = _read_file(app_dir / "cover.md")
-    prep_notes = _read_json(app_dir / "prep-notes.json")
-    salary_research = _read_json(app_dir / "salary-research.json")
-    referral_search = _read_json(app_dir / "referral-search.json")
-    follow_up = _read_json(app_dir / "follow-up.json")
-
-    return Application(
+    # Metadata and sidecar models are already validated; skip re-validation
+    return Application.model_construct(
         application_id=application_id,
         status=metadata.status,
         job=metadata.job,
-        jd=jd,
-        gap_analysis=GapAnalysis.model_validate(gap_analysis) if gap_analysis else None,
-        cv_tailored=cv_tailored,
-        cover_letter=cover_letter,
-        interview_prep=InterviewPrep.model_validate(prep_notes) if prep_notes else None,
-        salary_research=SalaryResearch.model_validate(salary_research) if salary_research else None,
-        referral_search=ReferralSearch.model_validate(referral_search) if referral_search else None,
-        follow_up=FollowUp.model_validate(follow_up) if follow_up else None,
+        jd=_read_file(app_dir / "jd.md"),
+        gap_analysis=_read_model(app_dir / "gap-analysis.json", GapAnalysis),
+        cv_tailored=_read_file(app_dir / "cv-tailored.md"),
+        cover_letter=_read_file(app_dir / "cover.md"),
+        interview_prep=_read_model(app_dir / "prep-notes.json", InterviewPrep),
+        salary_research=_read_model(app_dir / "salary-research.json", SalaryResearch),
+        referral_search=_read_model(app_dir / "referral-search.json", ReferralSearch),
+        follow_up=_read_model(app_dir / "follow-up.json", FollowUp),
         created_at=metadata.created_at,
         updated_at=metadata.updated_at,
     )
@@ -213,23 +231,13 @@ def get_application(application_id: str) -> Optional[Application]:
 
 def list_applications(include_archived: bool = False) -> list[ApplicationSummary]:
     """List all applications with summary info."""
+    index = _load_index()
     applications = []
-    for app_dir in sorted(APPLICATIONS_DIR.iterdir(), reverse=True):
-        if not app_dir.is_dir():
+    for application_id in sorted(index, reverse=True):
+        summary = index[application_id]
+        if not include_archived and summary["archived"]:
             continue
-        metadata = _load_metadata(app_dir.name)
-        if metadata:
-            if not include_archived and metadata.archived:
-                continue
-            applications.append(ApplicationSummary(
-                application_id=metadata.application_id,
-                job_id=metadata.job.job_id,
-                job_title=metadata.job.title,
-                company=metadata.job.company,
-                status=metadata.status,
-                archived=metadata.archived,
-                created_at=metadata.created_at,
-            ))
+        applications.append(ApplicationSummary(**summary))
     return applications
 
 
@@ -239,41 +247,23 @@ def delete_application(application_id: str) -> bool:
     if not app_dir.exists():
         return False
     shutil.rmtree(app_dir)
+    _update_index(application_id, None)
     return True
 
 
 def archive_application(application_id: str) -> bool:
     """Archive an application."""
-    metadata = _load_metadata(application_id)
-    if not metadata:
-        return False
-    metadata.archived = True
-    metadata.updated_at = datetime.now(timezone.utc).isoformat()
-    _save_metadata(application_id, metadata)
-    return True
+    return _patch_metadata(application_id, {"archived": True})
 
 
 def unarchive_application(application_id: str) -> bool:
     """Unarchive an application."""
-    metadata = _load_metadata(application_id)
-    if not metadata:
-        return False
-    metadata.archived = False
-    metadata.updated_at = datetime.now(timezone.utc).isoformat()
-    _save_metadata(application_id, metadata)
-    return True
+    return _patch_metadata(application_id, {"archived": False})
 
 
 def update_application_status(application_id: str, status: str, error: str | None = None) -> bool:
     """Update application status."""
-    metadata = _load_metadata(application_id)
-    if not metadata:
-        return False
-    metadata.status = status
-    metadata.error = error
-    metadata.updated_at = datetime.now(timezone.utc).isoformat()
-    _save_metadata(application_id, metadata)
-    return True
+    return _patch_metadata(application_id, {"status": status, "error": error})
 
 
 def save_jd(application_id: str, jd_content: str) -> bool:
@@ -290,12 +280,12 @@ def save_gap_analysis(application_id: str, gap_analysis: GapAnalysis) -> bool:
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
-    _write_json(app_dir / "gap-analysis.json", gap_analysis.model_dump())
+    _write_model(app_dir / "gap-analysis.json", gap_analysis)
     return True
 
 
 def save_cv_tailored(application_id: str, content: str) -> bool:
-    """Save tailored CV, versioning previous if exists. Auto-generates DOCX."""
+    """Save tailored CV, versioning previous if exists. DOCX is generated in the background."""
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
@@ -305,28 +295,18 @@ def save_cv_tailored(application_id: str, content: str) -> bool:
         _version_file(application_id, cv_path)
     cv_path.write_text(content)
 
-    # Auto-generate DOCX
-    try:
-        markdown_to_docx(content, app_dir / "cv.docx")
-    except Exception:
-        pass  # DOCX generation is best-effort, don't fail the save
-
+    _generate_docx_async(application_id, content, app_dir / "cv.docx")
     return True
 
 
 def save_cover_letter(application_id: str, content: str) -> bool:
-    """Save cover letter. Auto-generates DOCX."""
+    """Save cover letter. DOCX is generated in the background."""
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
     (app_dir / "cover.md").write_text(content)
 
-    # Auto-generate DOCX
-    try:
-        markdown_to_docx(content, app_dir / "cover.docx")
-    except Exception:
-        pass  # DOCX generation is best-effort, don't fail the save
-
+    _generate_docx_async(application_id, content, app_dir / "cover.docx")
     return True
 
 
@@ -335,7 +315,7 @@ def save_interview_prep(application_id: str, prep: InterviewPrep) -> bool:
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
-    _write_json(app_dir / "prep-notes.json", prep.model_dump())
+    _write_model(app_dir / "prep-notes.json", prep)
     return True
 
 
@@ -344,7 +324,7 @@ def save_salary_research(application_id: str, research: SalaryResearch) -> bool:
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
-    _write_json(app_dir / "salary-research.json", research.model_dump())
+    _write_model(app_dir / "salary-research.json", research)
     return True
 
 
@@ -353,7 +333,7 @@ def save_referral_search(application_id: str, search: ReferralSearch) -> bool:
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
-    _write_json(app_dir / "referral-search.json", search.model_dump())
+    _write_model(app_dir / "referral-search.json", search)
     return True
 
 
@@ -362,71 +342,238 @@ def save_follow_up(application_id: str, follow_up: FollowUp) -> bool:
     app_dir = _get_app_dir(application_id)
     if not app_dir.exists():
         return False
-    _write_json(app_dir / "follow-up.json", follow_up.model_dump())
+    _write_model(app_dir / "follow-up.json", follow_up)
     return True
 
 
 # --- File Helpers ---
 
 
+def _content_hash(text: str) -> str:
+    """Fast fingerprint of document content (not for security)."""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _render_docx(application_id: str, markdown: str, output_path: Path) -> None:
+    """Convert markdown to DOCX unless the file already matches this content.
+
+    The hash of the last rendered markdown is kept in metadata as
+    cv_docx_hash / cover_docx_hash, keyed by the output file's stem.
+    """
+    hash_key = f"{output_path.stem}_docx_hash"
+    content_hash = _content_hash(markdown)
+    metadata = _read_json(_get_app_dir(application_id) / "metadata.json") or {}
+    if metadata.get(hash_key) == content_hash and output_path.exists():
+        return
+    markdown_to_docx(markdown, output_path)
+    _set_docx_hash(application_id, hash_key, content_hash)
+
+
+def _generate_docx_async(application_id: str, markdown: str, output_path: Path) -> Future:
+    """Queue best-effort DOCX generation; failures are logged, never raised."""
+    future = _DOCX_EXECUTOR.submit(_render_docx, application_id, markdown, output_path)
+
+    def _log_failure(f: Future) -> None:
+        exc = f.exception()
+        if exc is not None:
+            print(f"DOCX generation failed for {output_path}: {exc}", file=sys.stderr)
+
+    future.add_done_callback(_log_failure)
+    return future
+
+
 def _load_metadata(application_id: str) -> Optional[ApplicationMetadata]:
     """Load application metadata."""
     path = _get_app_dir(application_id) / "metadata.json"
     data = _read_json(path)
-    if data:
-        return ApplicationMetadata.model_validate(data)
-    return None
+    if not data:
+        return None
+    # Trusted: the file is our own output, written from a validated model
+    return ApplicationMetadata.model_construct(
+        **{**data, "job": JobSummary.model_construct(**data["job"])}
+    )
 
 
 def _save_metadata(application_id: str, metadata: ApplicationMetadata) -> None:
     """Save application metadata."""
     path = _get_app_dir(application_id) / "metadata.json"
-    _write_json(path, metadata.model_dump())
+    data = metadata.model_dump()
+    _write_json(path, data)
+    _update_index(application_id, _summary_fields(data))
+
+
+def _patch_metadata(application_id: str, changes: dict) -> bool:
+    """Merge changes into metadata.json and bump updated_at.
+
+    Works on the raw dict: the file is our own output, so the untouched
+    fields (job summary, versions, ...) skip a validate/dump round-trip.
+    """
+    path = _get_app_dir(application_id) / "metadata.json"
+    with _METADATA_LOCK:
+        data = _read_json(path)
+        if not data:
+            return False
+        data.update(changes)
+        data["updated_at"] = _utc_now_iso()
+        _write_json(path, data)
+        _update_index(application_id, _summary_fields(data))
+    return True
+
+
+def _set_docx_hash(application_id: str, hash_key: str, content_hash: str) -> None:
+    """Record the hash of the last rendered markdown in metadata.json.
+
+    Render bookkeeping, not a user edit: updated_at is left alone, and the
+    summary index (which holds no hash fields) is not rewritten.
+    """
+    path = _get_app_dir(application_id) / "metadata.json"
+    with _METADATA_LOCK:
+        data = _read_json(path)
+        if data:
+            data[hash_key] = content_hash
+            _write_json(path, data)
+
+
+# --- Summary Index ---
+
+
+def _summary_fields(metadata: dict) -> dict:
+    """Project raw metadata onto the ApplicationSummary fields."""
+    job = metadata["job"]
+    return {
+        "application_id": metadata["application_id"],
+        "job_id": job["job_id"],
+        "job_title": job["title"],
+        "company": job["company"],
+        "status": metadata.get("status", "pending"),
+        "archived": metadata.get("archived", False),
+        "created_at": metadata["created_at"],
+    }
+
+
+def _list_app_ids() -> set[str]:
+    """Application directory names, from a single directory scan."""
+    with os.scandir(APPLICATIONS_DIR) as entries:
+        return {
+            e.name for e in entries
+            if e.is_dir() and not e.name.startswith(("_", "."))
+        }
+
+
+def _update_index(application_id: str, summary: Optional[dict]) -> None:
+    """Set (or with None, drop) one entry of the summary index."""
+    index_path = APPLICATIONS_DIR / _INDEX_NAME
+    with open(APPLICATIONS_DIR / _INDEX_LOCK_NAME, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        index = _read_json(index_path) or {}
+        if summary is None:
+            index.pop(application_id, None)
+        else:
+            index[application_id] = summary
+        _write_json(index_path, index)
+
+
+def _load_index() -> dict:
+    """Read the summary index, reconciling it with the directories on disk.
+
+    Directories created or removed outside this module (manual cleanup, an
+    older server version) are picked up here, so a missing or stale index
+    is rebuilt lazily rather than trusted.
+    """
+    index_path = APPLICATIONS_DIR / _INDEX_NAME
+    with open(APPLICATIONS_DIR / _INDEX_LOCK_NAME, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        index = _read_json(index_path) or {}
+        app_ids = _list_app_ids()
+        if index.keys() == app_ids:
+            return index
+
+        reconciled = {k: v for k, v in index.items() if k in app_ids}
+        for application_id in app_ids - reconciled.keys():
+            data = _read_json(_get_app_dir(application_id) / "metadata.json")
+            if data:
+                reconciled[application_id] = _summary_fields(data)
+        if reconciled != index:
+            _write_json(index_path, reconciled)
+        return reconciled
 
 
 def _read_file(path: Path) -> Optional[str]:
     """Read text file, return None if not exists."""
-    if path.exists():
-        return path.read_text()
-    return None
+    try:
+        return path.read_bytes().decode()
+    except FileNotFoundError:
+        return None
 
 
 def _read_json(path: Path) -> Optional[dict]:
     """Read JSON file, return None if not exists or invalid."""
-    if not path.exists():
+    try:
+        return json.loads(path.read_bytes())
+    except (json.JSONDecodeError, OSError):
         return None
+
+
+def _read_model(path: Path, model: type[M]) -> Optional[M]:
+    """Parse a JSON sidecar straight into its model, None if missing or invalid.
+
+    Empty objects ({}) are treated as missing, matching _read_json's falsy check.
+    """
     try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, IOError):
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return None
+    try:
+        data = model.model_validate_json(raw)
+    except ValidationError:
+        return None
+    return data if data.model_fields_set else None
+
+
+def _write_model(path: Path, model: BaseModel) -> None:
+    """Write a model as compact JSON atomically, without a dict intermediate."""
+    _atomic_write_bytes(path, model.model_dump_json().encode())
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
 
 
 def _write_json(path: Path, data: dict) -> None:
-    """Write JSON file with pretty formatting."""
-    path.write_text(json.dumps(data, indent=2))
+    """Write compact JSON atomically."""
+    _atomic_write_bytes(path, to_json(data))
 
 
 def _version_file(application_id: str, path: Path) -> None:
     """Create versioned backup of file."""
-    metadata = _load_metadata(application_id)
+    metadata = _read_json(_get_app_dir(application_id) / "metadata.json")
     if not metadata:
         return
 
-    # Find next version number
-    stem = path.stem
+    # Find next version number with a single directory scan
+    prefix = f"{path.stem}.v"
     suffix = path.suffix
-    version = 1
-    while (path.parent / f"{stem}.v{version}{suffix}").exists():
-        version += 1
+    versions = []
+    with os.scandir(path.parent) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix):
+                number = name[len(prefix):len(name) - len(suffix)]
+                if number.isdigit():
+                    versions.append(int(number))
+    version = max(versions, default=0) + 1
 
     # Move current to versioned
-    versioned_path = path.parent / f"{stem}.v{version}{suffix}"
+    versioned_path = path.parent / f"{prefix}{version}{suffix}"
     path.rename(versioned_path)
 
     # Track version
-    metadata.versions.append(versioned_path.name)
-    metadata.updated_at = datetime.now(timezone.utc).isoformat()
-    _save_metadata(application_id, metadata)
+    tracked = metadata.get("versions", [])
+    if versioned_path.name not in tracked:
+        _patch_metadata(application_id, {"versions": [*tracked, versioned_path.name]})
 
 
 # --- Export Functions ---
@@ -468,8 +615,10 @@ def export_document(
     output_filename = f"{doc_type}.docx"
     output_path = app_dir / output_filename
 
+    # Run on the DOCX worker so a pending background render of the same
+    # file finishes first; unchanged content skips conversion entirely.
     try:
-        markdown_to_docx(markdown_content, output_path)
+        _DOCX_EXECUTOR.submit(_render_docx, application_id, markdown_content, output_path).result()
     except Exception as e:
         return {"status": "error", "error": f"Export failed: {str(e)}"}
 
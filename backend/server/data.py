@@ -4,18 +4,26 @@ For API documentation including data structures and field definitions,
 see: references/api.md
 """
 
-import hashlib
-import json
-from datetime import datetime
+import os
+import re
+import secrets
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json, to_json
 
 from server.models import (
     Job, SearchParams, SearchResults,
     Selection, Selections,
     DeepDive, DeepDives,
     Research, Insights, Conclusions, Recommendations, ResearchNotes,
+    JobDescription, EnhancedInsights,
     Note, Notes,
+    _utc_now_iso,
 )
 
 # Re-export models for backward compatibility
@@ -25,17 +33,19 @@ __all__ = [
     "Selection", "Selections",
     "DeepDive", "DeepDives",
     "Research", "Insights", "Conclusions", "Recommendations",
+    "JobDescription", "EnhancedInsights",
     "Note", "Notes",
     # Constants
     "DATA_DIR", "RESULTS_FILE", "SELECTIONS_FILE", "DEEP_DIVES_FILE", "NOTES_FILE",
     # File operations
-    "_read_json", "_write_json",
+    "_read_json", "_write_json", "_write_model", "batch_writes",
     # API functions
     "get_results", "save_results",
     "get_selections", "save_selections", "select_jobs", "deselect_jobs", "get_selections_by_source",
-    "get_deep_dives", "get_deep_dive_by_id", "save_deep_dive", "remove_deep_dives",
-    "delete_deep_dive", "archive_deep_dives", "unarchive_deep_dives",
-    "get_jobs_by_ids", "remove_jobs", "update_job",
+    "get_deep_dives", "get_deep_dives_json", "get_deep_dive_by_id", "save_deep_dive", "remove_deep_dives",
+    "delete_deep_dive", "delete_deep_dives", "archive_deep_dives", "unarchive_deep_dives",
+    "get_job_by_id", "get_jobs_by_ids", "remove_jobs", "update_job", "update_jobs",
+    "title_company_key", "get_existing_job_keys",
     "get_notes", "add_note", "remove_note",
     "JobNotFoundError",
     # Company knowledge
@@ -52,6 +62,27 @@ DEEP_DIVES_FILE = DATA_DIR / "deep_dives.json"
 NOTES_FILE = DATA_DIR / "notes.json"
 
 
+M = TypeVar("M", bound=BaseModel)
+
+
+@dataclass
+class _CacheEntry:
+    """A validated model, the (mtime_ns, size) it was read at, and values derived from it."""
+    stamp: tuple[int, int]
+    model: BaseModel
+    derived: dict[str, Any] = field(default_factory=dict)
+
+
+# Validated models keyed by file. Instances are shared between callers (and
+# threads) and are never edited in place: writers build a copy with
+# model_copy(update=...) and pass it to _write_model, which refreshes the entry.
+# A writer that fails before or during the write leaves cache and disk agreeing.
+_MODEL_CACHE: dict[Path, _CacheEntry] = {}
+
+# Per-thread pending writes while inside batch_writes(); None outside a batch.
+_batch = threading.local()
+
+
 class JobNotFoundError(Exception):
     """Raised when trying to save a deep dive for a non-existent job."""
     pass
@@ -70,18 +101,124 @@ def _read_json(path: Path, default: dict) -> dict:
     if not path.exists():
         return default
     try:
-        data = json.loads(path.read_text())
+        data = from_json(path.read_bytes())
         # Must be a dict, not a list
         if not isinstance(data, dict):
             return default
         return data
-    except (json.JSONDecodeError, IOError):
+    except (ValueError, IOError):
         return default
 
 
 def _write_json(path: Path, data: dict) -> None:
     """Write JSON file with pretty formatting."""
-    path.write_text(json.dumps(data, indent=2))
+    pending = getattr(_batch, "pending", None)
+    if pending:
+        pending.pop(path, None)
+    _atomic_write_bytes(path, to_json(data, indent=2))
+    _MODEL_CACHE.pop(path, None)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write to a temp file, fsync, then os.replace into place.
+
+    Readers see either the old or the new file, never a partial one.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_model(path: Path, model: type[M], default: dict) -> M:
+    """Read and validate a JSON file, reusing the cached model while it is unchanged."""
+    pending = getattr(_batch, "pending", None)
+    if pending and path in pending:
+        return pending[path]
+    stamp = _file_stamp(path)
+    cached = _MODEL_CACHE.get(path)
+    if stamp is not None and cached is not None and cached.stamp == stamp:
+        return cached.model
+    try:
+        # Fast path: parse and validate in one pass inside pydantic-core
+        result = model.model_validate_json(path.read_bytes())
+    except (ValidationError, OSError):
+        # Missing, malformed or non-object file: fall back to the default
+        result = model.model_validate(_read_json(path, default))
+    if stamp is not None:
+        _MODEL_CACHE[path] = _CacheEntry(stamp, result)
+    return result
+
+
+def _derived(path: Path, model: M, name: str, build: Callable[[M], Any]) -> Any:
+    """Memoize build(model) alongside the cached model for path.
+
+    Rebuilt whenever the file is re-read or rewritten. Models that are not
+    the cached instance, or that have a pending batched write, are built fresh.
+    """
+    entry = _MODEL_CACHE.get(path)
+    pending = getattr(_batch, "pending", None)
+    if entry is None or entry.model is not model or (pending and path in pending):
+        return build(model)
+    if name not in entry.derived:
+        entry.derived[name] = build(model)
+    return entry.derived[name]
+
+
+def _index_by_job_id(items: list) -> dict[str, int]:
+    """Map job_id -> position of its first occurrence in items."""
+    index: dict[str, int] = {}
+    for i, item in enumerate(items):
+        index.setdefault(item.job_id, i)
+    return index
+
+
+def _write_model(path: Path, model: BaseModel) -> None:
+    """Write a model to its JSON file and cache it as the file's current contents.
+
+    Inside batch_writes() the write is deferred until the batch ends.
+    """
+    pending = getattr(_batch, "pending", None)
+    if pending is not None:
+        pending[path] = model
+        return
+    # None fields are all defaults, so dropping them round-trips losslessly
+    data = model.__pydantic_serializer__.to_json(model, indent=2, exclude_none=True)
+    _atomic_write_bytes(path, data)
+    _MODEL_CACHE[path] = _CacheEntry(_file_stamp(path), model)
+
+
+@contextmanager
+def batch_writes():
+    """Coalesce model writes in this block into one write per file.
+
+    Reads inside the block (on this thread) see the pending models; other
+    threads keep seeing the cached ones until the block commits. If the
+    block raises, nothing is written. Nested blocks join the outermost one.
+    """
+    if getattr(_batch, "pending", None) is not None:
+        yield
+        return
+    _batch.pending = {}
+    try:
+        yield
+        pending = _batch.pending
+        _batch.pending = None
+        for path, model in pending.items():
+            _write_model(path, model)
+    finally:
+        _batch.pending = None
 
 
 # --- Results API ---
@@ -89,13 +226,44 @@ def _write_json(path: Path, data: dict) -> None:
 
 def get_results() -> SearchResults:
     """Get current search results."""
-    data = _read_json(RESULTS_FILE, {"search_params": {"query": ""}, "jobs": []})
-    return SearchResults.model_validate(data)
+    return _load_model(RESULTS_FILE, SearchResults, {"search_params": {"query": ""}, "jobs": []})
 
 
 def save_results(results: SearchResults) -> None:
     """Save search results."""
-    _write_json(RESULTS_FILE, results.model_dump())
+    _write_model(RESULTS_FILE, results)
+
+
+def _valid_job_ids() -> frozenset[str]:
+    """IDs of all jobs in the current job list, memoized per file version."""
+    return _derived(RESULTS_FILE, get_results(), "job_ids", lambda m: frozenset(j.job_id for j in m.jobs))
+
+
+# Runs of whitespace and separator punctuation, folded to one space in dedupe
+# keys. Meaningful symbols like "+" and "#" are kept so "C++" and "C#" differ.
+_KEY_NOISE_RE = re.compile(r"[\s\-–—/|,.()]+")
+
+
+def _key_part(text: str) -> str:
+    return _KEY_NOISE_RE.sub(" ", text.casefold()).strip()
+
+
+def title_company_key(title: str, company: str) -> str:
+    """Case-, whitespace- and separator-insensitive "title:company" key for deduplication.
+
+    casefold() rather than lower() so Unicode variants (e.g. "ß"/"ss") match;
+    "Sr. PM – AI" and "sr pm - ai" produce the same key.
+    """
+    return f"{_key_part(title)}:{_key_part(company)}"
+
+
+def get_existing_job_keys() -> tuple[frozenset[str], frozenset[str]]:
+    """Return (job_ids, title_company_keys) of the board, memoized per file version."""
+    title_keys = _derived(
+        RESULTS_FILE, get_results(), "title_keys",
+        lambda m: frozenset(title_company_key(j.title, j.company) for j in m.jobs),
+    )
+    return _valid_job_ids(), title_keys
 
 
 # --- Selections API ---
@@ -103,21 +271,16 @@ def save_results(results: SearchResults) -> None:
 
 def get_selections() -> Selections:
     """Get current selections, pruning any orphaned IDs."""
-    data = _read_json(SELECTIONS_FILE, {"selections": [], "selected_ids": []})
-    selections = Selections.model_validate(data)
+    selections = _load_model(SELECTIONS_FILE, Selections, {"selections": []})
+    if not selections.selections:
+        return selections
 
     # Prune orphaned selections (IDs that no longer exist in job list)
-    results = get_results()
-    valid_ids = {job.job_id for job in results.jobs}
-
-    # Prune new-style selections
+    valid_ids = _valid_job_ids()
     pruned_selections = [s for s in selections.selections if s.job_id in valid_ids]
-    # Prune legacy selected_ids
-    pruned_ids = [id for id in selections.selected_ids if id in valid_ids]
 
-    if len(pruned_selections) != len(selections.selections) or len(pruned_ids) != len(selections.selected_ids):
-        selections.selections = pruned_selections
-        selections.selected_ids = pruned_ids
+    if len(pruned_selections) != len(selections.selections):
+        selections = selections.model_copy(update={"selections": pruned_selections})
         save_selections(selections)
 
     return selections
@@ -125,7 +288,7 @@ def get_selections() -> Selections:
 
 def save_selections(selections: Selections) -> None:
     """Save selections."""
-    _write_json(SELECTIONS_FILE, selections.model_dump())
+    _write_model(SELECTIONS_FILE, selections)
 
 
 def select_jobs(job_ids: list[str], source: str = "claude") -> dict:
@@ -141,11 +304,11 @@ def select_jobs(job_ids: list[str], source: str = "claude") -> dict:
     if source not in ("claude", "user"):
         return {"status": "error", "error": "Invalid source. Use: claude, user", "code": "INVALID_PARAM"}
 
-    results = get_results()
-    valid_ids = {job.job_id for job in results.jobs}
+    valid_ids = _valid_job_ids()
 
     selections = get_selections()
-    existing_ids = {s.job_id for s in selections.selections}
+    selected = list(selections.selections)
+    existing_ids = {s.job_id for s in selected}
 
     added = 0
     not_found = []
@@ -155,15 +318,11 @@ def select_jobs(job_ids: list[str], source: str = "claude") -> dict:
             not_found.append(job_id)
             continue
         if job_id not in existing_ids:
-            selections.selections.append(Selection(job_id=job_id, source=source))
-            # Also add to legacy field for backward compatibility
-            if job_id not in selections.selected_ids:
-                selections.selected_ids.append(job_id)
+            selected.append(Selection(job_id=job_id, source=source))
             existing_ids.add(job_id)
             added += 1
 
-    selections.updated_at = datetime.utcnow().isoformat() + "Z"
-    save_selections(selections)
+    save_selections(selections.model_copy(update={"selections": selected, "updated_at": _utc_now_iso()}))
 
     return {"status": "ok", "added": added, "not_found": not_found}
 
@@ -171,19 +330,12 @@ def select_jobs(job_ids: list[str], source: str = "claude") -> dict:
 def deselect_jobs(job_ids: list[str]) -> dict:
     """Deselect jobs."""
     selections = get_selections()
+    ids = set(job_ids)
 
-    removed = 0
-    for job_id in job_ids:
-        original_len = len(selections.selections)
-        selections.selections = [s for s in selections.selections if s.job_id != job_id]
-        if len(selections.selections) < original_len:
-            removed += 1
-        # Also remove from legacy field
-        if job_id in selections.selected_ids:
-            selections.selected_ids.remove(job_id)
+    kept = [s for s in selections.selections if s.job_id not in ids]
+    removed = len(selections.selections) - len(kept)
 
-    selections.updated_at = datetime.utcnow().isoformat() + "Z"
-    save_selections(selections)
+    save_selections(selections.model_copy(update={"selections": kept, "updated_at": _utc_now_iso()}))
 
     return {"status": "ok", "removed": removed}
 
@@ -195,9 +347,6 @@ def get_selections_by_source(source: Optional[str] = None) -> dict:
     if source is None:
         claude_ids = [s.job_id for s in selections.selections if s.source == "claude"]
         user_ids = [s.job_id for s in selections.selections if s.source == "user"]
-        # Include legacy selected_ids as user selections for backward compatibility
-        legacy_ids = [id for id in selections.selected_ids if id not in claude_ids and id not in user_ids]
-        user_ids = user_ids + legacy_ids
         all_ids = claude_ids + user_ids
         return {"claude": claude_ids, "user": user_ids, "selected_ids": all_ids}
     elif source in ("claude", "user"):
@@ -211,116 +360,162 @@ def get_selections_by_source(source: Optional[str] = None) -> dict:
 
 def get_deep_dives() -> DeepDives:
     """Get all deep dives. Pure read - no side effects."""
-    data = _read_json(DEEP_DIVES_FILE, {"deep_dives": []})
-    return DeepDives.model_validate(data)
+    return _load_model(DEEP_DIVES_FILE, DeepDives, {"deep_dives": []})
+
+
+def get_deep_dives_json(include_archived: bool = False) -> bytes:
+    """GET /deep-dives body as JSON bytes, memoized per file version."""
+    dives = get_deep_dives()
+    if include_archived:
+        return _derived(DEEP_DIVES_FILE, dives, "json_all", to_json)
+    return _derived(
+        DEEP_DIVES_FILE, dives, "json_active",
+        lambda m: to_json(DeepDives.model_construct(deep_dives=[d for d in m.deep_dives if not d.archived])),
+    )
 
 
 def get_deep_dive_by_id(job_id: str) -> Optional[DeepDive]:
     """Get a single deep dive by job ID."""
     dives = get_deep_dives()
-    return next((d for d in dives.deep_dives if d.job_id == job_id), None)
+    i = _deep_dive_index(dives).get(job_id)
+    return dives.deep_dives[i] if i is not None else None
+
+
+def _deep_dive_index(dives: DeepDives) -> dict[str, int]:
+    """job_id -> position in dives.deep_dives, memoized per file version."""
+    return _derived(DEEP_DIVES_FILE, dives, "by_job_id", lambda m: _index_by_job_id(m.deep_dives))
 
 
 def save_deep_dive(deep_dive: DeepDive) -> None:
     """Save or update a single deep dive. Validates job exists first."""
     # Validate job exists
-    results = get_results()
-    valid_ids = {job.job_id for job in results.jobs}
-    if deep_dive.job_id not in valid_ids:
+    if deep_dive.job_id not in _valid_job_ids():
         raise JobNotFoundError(f"Job {deep_dive.job_id} not found in job list")
 
     dives = get_deep_dives()
 
     # Update existing or append new
-    updated = False
-    for i, d in enumerate(dives.deep_dives):
-        if d.job_id == deep_dive.job_id:
-            dives.deep_dives[i] = deep_dive
-            updated = True
-            break
-
-    if not updated:
-        dives.deep_dives.append(deep_dive)
+    i = _deep_dive_index(dives).get(deep_dive.job_id)
+    updated = list(dives.deep_dives)
+    if i is not None:
+        updated[i] = deep_dive
+    else:
+        updated.append(deep_dive)
 
-    _write_json(DEEP_DIVES_FILE, dives.model_dump())
+    _write_model(DEEP_DIVES_FILE, dives.model_copy(update={"deep_dives": updated}))
 
 
 def remove_deep_dives(job_ids: list[str]) -> int:
     """Remove deep dives for given job IDs. Returns count removed."""
     dives = get_deep_dives()
-    original_count = len(dives.deep_dives)
-    dives.deep_dives = [d for d in dives.deep_dives if d.job_id not in job_ids]
-    removed_count = original_count - len(dives.deep_dives)
+    ids = set(job_ids)
+    kept = [d for d in dives.deep_dives if d.job_id not in ids]
+    removed_count = len(dives.deep_dives) - len(kept)
     if removed_count > 0:
-        _write_json(DEEP_DIVES_FILE, dives.model_dump())
+        _write_model(DEEP_DIVES_FILE, dives.model_copy(update={"deep_dives": kept}))
     return removed_count
 
 
 def delete_deep_dive(job_id: str) -> bool:
     """Delete a single deep dive by job ID. Returns True if found and deleted."""
     dives = get_deep_dives()
-    original_count = len(dives.deep_dives)
-    dives.deep_dives = [d for d in dives.deep_dives if d.job_id != job_id]
-    if len(dives.deep_dives) < original_count:
-        _write_json(DEEP_DIVES_FILE, dives.model_dump())
+    kept = [d for d in dives.deep_dives if d.job_id != job_id]
+    if len(kept) < len(dives.deep_dives):
+        _write_model(DEEP_DIVES_FILE, dives.model_copy(update={"deep_dives": kept}))
         return True
     return False
 
 
+def delete_deep_dives(job_ids: list[str]) -> tuple[int, list[str]]:
+    """Delete deep dives by job IDs in one rewrite. Returns (deleted_count, not_found_ids)."""
+    dives = get_deep_dives()
+    found = set(job_ids) & _deep_dive_index(dives).keys()
+    not_found = [jid for jid in job_ids if jid not in found]
+    if found:
+        kept = [d for d in dives.deep_dives if d.job_id not in found]
+        _write_model(DEEP_DIVES_FILE, dives.model_copy(update={"deep_dives": kept}))
+    return len(found), not_found
+
+
 def archive_deep_dives(job_ids: list[str]) -> tuple[int, list[str]]:
     """Archive deep dives by job IDs. Returns (archived_count, not_found_ids)."""
     dives = get_deep_dives()
+    updated = list(dives.deep_dives)
     archived = 0
     found_ids = set()
-    for d in dives.deep_dives:
-        if d.job_id in job_ids and not d.archived:
-            d.archived = True
-            d.updated_at = datetime.utcnow().isoformat() + "Z"
+    remaining = set(job_ids)
+    now = _utc_now_iso()  # One timestamp for the whole batch
+    for i, d in enumerate(updated):
+        if d.job_id in remaining and not d.archived:
+            updated[i] = d.model_copy(update={"archived": True, "updated_at": now})
             archived += 1
             found_ids.add(d.job_id)
+            remaining.discard(d.job_id)
+            if not remaining:
+                break
     not_found = [jid for jid in job_ids if jid not in found_ids]
     if archived > 0:
-        _write_json(DEEP_DIVES_FILE, dives.model_dump())
+        _write_model(DEEP_DIVES_FILE, dives.model_copy(update={"deep_dives": updated}))
     return archived, not_found
 
 
 def unarchive_deep_dives(job_ids: list[str]) -> tuple[int, list[str]]:
     """Unarchive deep dives by job IDs. Returns (unarchived_count, not_found_ids)."""
     dives = get_deep_dives()
+    updated = list(dives.deep_dives)
     unarchived = 0
     found_ids = set()
-    for d in dives.deep_dives:
-        if d.job_id in job_ids and d.archived:
-            d.archived = False
-            d.updated_at = datetime.utcnow().isoformat() + "Z"
+    remaining = set(job_ids)
+    now = _utc_now_iso()  # One timestamp for the whole batch
+    for i, d in enumerate(updated):
+        if d.job_id in remaining and d.archived:
+            updated[i] = d.model_copy(update={"archived": False, "updated_at": now})
             unarchived += 1
             found_ids.add(d.job_id)
+            remaining.discard(d.job_id)
+            if not remaining:
+                break
     not_found = [jid for jid in job_ids if jid not in found_ids]
     if unarchived > 0:
-        _write_json(DEEP_DIVES_FILE, dives.model_dump())
+        _write_model(DEEP_DIVES_FILE, dives.model_copy(update={"deep_dives": updated}))
     return unarchived, not_found
 
 
 # --- Jobs API ---
 
 
+def _job_index(results: SearchResults) -> dict[str, int]:
+    """job_id -> position in results.jobs, memoized per file version."""
+    return _derived(RESULTS_FILE, results, "by_job_id", lambda m: _index_by_job_id(m.jobs))
+
+
+def get_job_by_id(job_id: str) -> Optional[Job]:
+    """Get a single job by ID."""
+    results = get_results()
+    i = _job_index(results).get(job_id)
+    return results.jobs[i] if i is not None else None
+
+
 def get_jobs_by_ids(ids: list[str]) -> list[Job]:
-    """Get jobs by their IDs."""
+    """Get jobs by their IDs, in board order."""
     results = get_results()
-    return [j for j in results.jobs if j.job_id in ids]
+    index = _job_index(results)
+    positions = sorted({index[i] for i in ids if i in index})
+    return [results.jobs[p] for p in positions]
 
 
 def remove_jobs(ids: list[str]) -> tuple[int, list[str]]:
     """Remove jobs by their IDs. Returns (removed_count, not_found_ids)."""
-    results = get_results()
-    existing_ids = {j.job_id for j in results.jobs}
+    existing_ids = _valid_job_ids()
     not_found = [i for i in ids if i not in existing_ids]
 
-    results.jobs = [j for j in results.jobs if j.job_id not in ids]
     removed_count = len(ids) - len(not_found)
 
     if removed_count > 0:
-        _write_json(RESULTS_FILE, results.model_dump())
+        results = get_results()
+        remove_ids = set(ids)
+        kept = [j for j in results.jobs if j.job_id not in remove_ids]
+        _write_model(RESULTS_FILE, results.model_copy(update={"jobs": kept}))
     return removed_count, not_found
 
 
@@ -334,25 +529,39 @@ def update_job(job_id: str, updates: dict) -> Optional[Job]:
     Returns:
         Updated Job model, or None if job_id not found
     """
-    results = get_results()
+    return update_jobs({job_id: updates}).get(job_id)
 
-    # Find and update the job
-    for i, job in enumerate(results.jobs):
-        if job.job_id == job_id:
-            # Merge updates into existing job data
-            job_data = job.model_dump()
-            # Only update fields that exist in Job model and are provided
-            valid_fields = set(Job.model_fields.keys())
-            for key, value in updates.items():
-                if key in valid_fields and key != "job_id":  # Never allow ID change
-                    job_data[key] = value
 
-            updated_job = Job.model_validate(job_data)
-            results.jobs[i] = updated_job
-            _write_json(RESULTS_FILE, results.model_dump())
-            return updated_job
+def update_jobs(updates: dict[str, dict]) -> dict[str, Job]:
+    """Update several jobs in one load and one write.
 
-    return None
+    Args:
+        updates: job_id -> dict of field names to new values
+
+    Returns:
+        job_id -> updated Job model, for the IDs that were found
+    """
+    results = get_results()
+    index = _job_index(results)
+    jobs = list(results.jobs)
+    # Only update fields that exist in Job model and are provided
+    valid_fields = Job.model_fields.keys()
+
+    updated: dict[str, Job] = {}
+    for job_id, fields in updates.items():
+        i = index.get(job_id)
+        if i is None:
+            continue
+        # Merge updates into existing job data
+        job_data = jobs[i].model_dump()
+        for key, value in fields.items():
+            if key in valid_fields and key != "job_id":  # Never allow ID change
+                job_data[key] = value
+        jobs[i] = updated[job_id] = Job.model_validate(job_data)
+
+    if updated:
+        _write_model(RESULTS_FILE, results.model_copy(update={"jobs": jobs}))
+    return updated
 
 
 # --- Notes API ---
@@ -360,13 +569,21 @@ def update_job(job_id: str, updates: dict) -> Optional[Job]:
 
 def get_notes(job_id: Optional[str] = None) -> list[Note]:
     """Get notes, optionally filtered by job_id."""
-    data = _read_json(NOTES_FILE, {"notes": []})
-    notes_data = Notes.model_validate(data)
+    notes_data = _load_model(NOTES_FILE, Notes, {"notes": []})
     if job_id:
-        return [n for n in notes_data.notes if n.job_id == job_id]
+        by_job = _derived(NOTES_FILE, notes_data, "by_job_id", _group_notes_by_job)
+        return list(by_job.get(job_id, ()))
     return notes_data.notes
 
 
+def _group_notes_by_job(notes_data: Notes) -> dict[str, list[Note]]:
+    """job_id -> that job's notes, in file order."""
+    grouped: dict[str, list[Note]] = {}
+    for n in notes_data.notes:
+        grouped.setdefault(n.job_id, []).append(n)
+    return grouped
+
+
 def add_note(job_id: str, text: str) -> Note:
     """Add a note for a job.
 
@@ -380,38 +597,29 @@ def add_note(job_id: str, text: str) -> Note:
     Raises:
         JobNotFoundError: If job_id doesn't exist
     """
-    timestamp = datetime.utcnow().isoformat()
-    note_id = f"note_{hashlib.md5(f'{job_id}:{timestamp}'.encode()).hexdigest()[:8]}"
-
     # Validate job exists
-    results = get_results()
-    valid_ids = {job.job_id for job in results.jobs}
-    if job_id not in valid_ids:
+    if job_id not in _valid_job_ids():
         raise JobNotFoundError(f"Job {job_id} not found")
 
     # Truncate text to 500 chars
     text = text[:500]
 
-    note = Note(note_id=note_id, job_id=job_id, text=text, created_at=timestamp + "Z")
+    note = Note(note_id=f"note_{secrets.token_hex(4)}", job_id=job_id, text=text, created_at=_utc_now_iso())
 
-    data = _read_json(NOTES_FILE, {"notes": []})
-    notes_data = Notes.model_validate(data)
-    notes_data.notes.append(note)
-    _write_json(NOTES_FILE, notes_data.model_dump())
+    notes_data = _load_model(NOTES_FILE, Notes, {"notes": []})
+    _write_model(NOTES_FILE, notes_data.model_copy(update={"notes": [*notes_data.notes, note]}))
 
     return note
 
 
 def remove_note(note_id: str) -> bool:
     """Remove a note by ID. Returns True if removed, False if not found."""
-    data = _read_json(NOTES_FILE, {"notes": []})
-    notes_data = Notes.model_validate(data)
+    notes_data = _load_model(NOTES_FILE, Notes, {"notes": []})
 
-    original_count = len(notes_data.notes)
-    notes_data.notes = [n for n in notes_data.notes if n.note_id != note_id]
+    kept = [n for n in notes_data.notes if n.note_id != note_id]
 
-    if len(notes_data.notes) < original_count:
-        _write_json(NOTES_FILE, notes_data.model_dump())
+    if len(kept) < len(notes_data.notes):
+        _write_model(NOTES_FILE, notes_data.model_copy(update={"notes": kept}))
         return True
     return False
 
@@ -419,14 +627,39 @@ def remove_note(note_id: str) -> bool:
 # --- Company Knowledge API ---
 
 
+# Common company suffixes. Optional groups run in reverse of the order they
+# used to be stripped one by one (" inc" first ... ".ai" last), so a single
+# anchored match removes the same trailing sequence.
+_COMPANY_SUFFIX_RE = re.compile(
+    r"(?:\.ai)?(?:\.io)?(?:\.com)?(?: ltd\.)?(?: ltd)?(?: llc)?(?: inc\.)?(?: inc)?$"
+)
+
+
 def normalize_company_name(name: str) -> str:
     """Normalize company name for matching."""
-    name = name.lower().strip()
-    # Strip common suffixes
-    for suffix in [" inc", " inc.", " llc", " ltd", " ltd.", ".com", ".io", ".ai"]:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)]
-    return name.strip()
+    return _COMPANY_SUFFIX_RE.sub("", name.lower().strip(), count=1).strip()
+
+
+def _normalized_companies() -> dict[str, tuple[str, str]]:
+    """job_id -> (company, normalized company), memoized per results.json version."""
+    return _derived(
+        RESULTS_FILE, get_results(), "normalized_companies",
+        lambda m: {j.job_id: (j.company, normalize_company_name(j.company)) for j in m.jobs},
+    )
+
+
+def _research_score(dd: DeepDive) -> tuple:
+    """Rank deep dives by research completeness, then recency."""
+    score = 0
+    # Has research_notes (most valuable)
+    notes = dd.research_notes
+    if notes:
+        score += len(notes.employee) + len(notes.customer) + len(notes.company)
+    # Has legacy research
+    if dd.research and dd.research.company:
+        c = dd.research.company
+        score += bool(c.size) + bool(c.funding) + bool(c.stage) + bool(c.product) + bool(c.market)
+    return (score, dd.updated_at or "")
 
 
 def find_company_research(company_name: str) -> dict:
@@ -438,19 +671,17 @@ def find_company_research(company_name: str) -> dict:
     if not normalized_query:
         return {"found": False}
 
-    # Get all jobs to map job_id -> company
-    results = get_results()
-    job_company_map = {job.job_id: job.company for job in results.jobs}
+    # job_id -> (company, normalized), built once per job list version
+    companies = _normalized_companies()
 
     # Get all deep dives and find matches
     dives = get_deep_dives()
     matches = []
 
     for dd in dives.deep_dives:
-        company = job_company_map.get(dd.job_id, "")
+        company, normalized_company = companies.get(dd.job_id, ("", ""))
         if not company:
             continue
-        normalized_company = normalize_company_name(company)
         # Match if query equals company or is contained in it (or vice versa)
         if normalized_query == normalized_company or normalized_query in normalized_company or normalized_company in normalized_query:
             matches.append((dd, company))
@@ -458,22 +689,8 @@ def find_company_research(company_name: str) -> dict:
     if not matches:
         return {"found": False}
 
-    # Score matches by completeness and recency
-    def research_score(dd: DeepDive) -> tuple:
-        score = 0
-        # Has research_notes (most valuable)
-        if dd.research_notes:
-            notes = dd.research_notes
-            score += len(notes.employee) + len(notes.customer) + len(notes.company)
-        # Has legacy research
-        if dd.research:
-            r = dd.research
-            if r.company:
-                score += sum(1 for v in [r.company.size, r.company.funding, r.company.stage, r.company.product, r.company.market] if v)
-        return (score, dd.updated_at or "")
-
     # Get the most complete deep dive
-    best_dd, best_company = max(matches, key=lambda x: research_score(x[0]))
+    best_dd, best_company = max(matches, key=lambda x: _research_score(x[0]))
 
     # Build summary
     summary_parts = []
@@ -15,6 +15,29 @@ TEXT_MUTED = RGBColor(0x73, 0x72, 0x6C)  # #73726c
 LINK_BLUE = RGBColor(0x6A, 0x9B, 0xCC)  # #6a9bcc
 FONT_FAMILY = "Calibri"
 
+# Sizes and spacings, built once (Length values are immutable ints)
+PT_0 = Pt(0)
+PT_2 = Pt(2)
+PT_6 = Pt(6)
+PT_8 = Pt(8)
+PT_10 = Pt(10)
+PT_10_5 = Pt(10.5)
+PT_11 = Pt(11)
+PT_20 = Pt(20)
+PT_21 = Pt(21)
+
+# Horizontal rule: three or more of -, * or _
+_HR_MATCH = re.compile(r'^[-*_]{3,}\s*$').match
+
+# Inline formatting. Named groups: bold_italic, bold, italic, link_text, link_url, plain
+_INLINE_FINDITER = re.compile(
+    r"(?:\*\*\*(?P<bold_italic>.+?)\*\*\*)"
+    r"|(?:\*\*(?P<bold>.+?)\*\*)"
+    r"|(?:\*(?P<italic>.+?)\*)"
+    r"|(?:\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\))"
+    r"|(?P<plain>[^*\[]+)"
+).finditer
+
 
 def _add_bottom_border(paragraph, color_hex: str, width: str = "4"):
     """Add bottom border to paragraph. color_hex without #, e.g. '788C5D'."""
@@ -41,18 +64,13 @@ def _styled_run(paragraph, text: str, size: Pt, color: RGBColor, bold: bool = Fa
     """Add a styled run to paragraph."""
     run = paragraph.add_run(text)
     run.bold = bold
-    run.font.size = size
-    run.font.name = FONT_FAMILY
-    run.font.color.rgb = color
+    font = run.font
+    font.size = size
+    font.name = FONT_FAMILY
+    font.color.rgb = color
     return run
 
 
-def _is_empty_or_hr(line: str) -> bool:
-    """Check if line is empty or a horizontal rule."""
-    stripped = line.strip()
-    return not stripped or bool(re.match(r'^[-*_]{3,}\s*$', stripped))
-
-
 def markdown_to_docx(markdown: str, output_path: Path) -> None:
     """Convert markdown to DOCX matching job_search CV styling."""
     doc = Document()
@@ -60,58 +78,67 @@ def markdown_to_docx(markdown: str, output_path: Path) -> None:
 
     # Reset Normal style to tight spacing
     style = doc.styles['Normal']
-    style.paragraph_format.space_before = Pt(0)
-    style.paragraph_format.space_after = Pt(10)
+    style.paragraph_format.space_before = PT_0
+    style.paragraph_format.space_after = PT_10
     style.paragraph_format.line_spacing = 1.0
 
     lines = markdown.split("\n")
     after_h1 = False  # Track if next paragraph is contact line
 
     for i, line in enumerate(lines):
-        # H4: Sub-heading - 10.5pt, bold, muted (check first - most specific)
-        if line.startswith("#### "):
+        stripped = line.strip()
+
+        # Heading level from the run of leading '#' (must be followed by a space)
+        level = 0
+        if line[:1] == "#":
+            hashes = len(line) - len(line.lstrip("#"))
+            if hashes <= 4 and line[hashes:hashes + 1] == " ":
+                level = hashes
+
+        # H4: Sub-heading - 10.5pt, bold, muted
+        if level == 4:
             p = doc.add_paragraph()
-            _styled_run(p, line[5:].strip(), Pt(10.5), TEXT_MUTED, bold=True)
-            p.paragraph_format.space_before = Pt(8)
-            p.paragraph_format.space_after = Pt(2)
+            _styled_run(p, line[5:].strip(), PT_10_5, TEXT_MUTED, bold=True)
+            p.paragraph_format.space_before = PT_8
+            p.paragraph_format.space_after = PT_2
             p.paragraph_format.keep_with_next = True
 
         # H3: Job title - 11pt, bold
-        elif line.startswith("### "):
+        elif level == 3:
             p = doc.add_paragraph()
-            _styled_run(p, line[4:].strip(), Pt(11), TEXT_PRIMARY, bold=True)
-            p.paragraph_format.space_before = Pt(10)
-            p.paragraph_format.space_after = Pt(2)
+            _styled_run(p, line[4:].strip(), PT_11, TEXT_PRIMARY, bold=True)
+            p.paragraph_format.space_before = PT_10
+            p.paragraph_format.space_after = PT_2
             p.paragraph_format.keep_with_next = True
 
         # H2: Section header - 10.5pt, uppercase, olive green, bordered
-        elif line.startswith("## "):
+        elif level == 2:
             p = doc.add_paragraph()
-            _styled_run(p, line[3:].strip().upper(), Pt(10.5), OLIVE_GREEN, bold=True)
-            p.paragraph_format.space_before = Pt(20)
-            p.paragraph_format.space_after = Pt(6)
+            _styled_run(p, line[3:].strip().upper(), PT_10_5, OLIVE_GREEN, bold=True)
+            p.paragraph_format.space_before = PT_20
+            p.paragraph_format.space_after = PT_6
             p.paragraph_format.keep_with_next = True
             _add_bottom_border(p, "788C5D", "8")
 
         # H1: Name - 21pt, bold
-        elif line.startswith("# "):
+        elif level == 1:
             p = doc.add_paragraph()
-            _styled_run(p, line[2:].strip(), Pt(21), TEXT_PRIMARY, bold=True)
-            p.space_after = Pt(2)
+            _styled_run(p, line[2:].strip(), PT_21, TEXT_PRIMARY, bold=True)
+            p.space_after = PT_2
             after_h1 = True
 
         # Bullet point
-        elif line.strip().startswith("- "):
+        elif stripped.startswith("- "):
             p = doc.add_paragraph(style="List Bullet")
-            _add_formatted_text(p, line.strip()[2:])
-            p.paragraph_format.space_before = Pt(0)
+            _add_formatted_text(p, stripped[2:])
+            p.paragraph_format.space_before = PT_0
             p.paragraph_format.line_spacing = 1.0
             # Space after last bullet in list
             next_line = lines[i + 1].strip() if i + 1 < len(lines) else ""
-            p.paragraph_format.space_after = Pt(0) if next_line.startswith("- ") else Pt(10)
+            p.paragraph_format.space_after = PT_0 if next_line.startswith("- ") else PT_10
 
         # Empty line or horizontal rule - reset state
-        elif _is_empty_or_hr(line):
+        elif not stripped or _HR_MATCH(stripped):
             after_h1 = False
 
         # Regular paragraph (or contact line if after H1)
@@ -119,16 +146,16 @@ def markdown_to_docx(markdown: str, output_path: Path) -> None:
             p = doc.add_paragraph()
             _add_formatted_text(p, line, is_contact_line=after_h1)
             p.paragraph_format.line_spacing = 1.0
-            p.paragraph_format.space_before = Pt(0)
-            p.paragraph_format.space_after = Pt(0)
+            p.paragraph_format.space_before = PT_0
+            p.paragraph_format.space_after = PT_0
             if after_h1:
-                p.paragraph_format.space_after = Pt(10)
+                p.paragraph_format.space_after = PT_10
                 _add_bottom_border(p, "E8E6DC", "4")
             else:
                 # Add space before next section heading
                 next_content = next((ln for ln in lines[i + 1:] if ln.strip()), "")
                 if next_content.startswith("#"):
-                    p.paragraph_format.space_after = Pt(8)
+                    p.paragraph_format.space_after = PT_8
             after_h1 = False
 
     doc.save(output_path)
@@ -136,42 +163,40 @@ def markdown_to_docx(markdown: str, output_path: Path) -> None:
 
 def _add_formatted_text(paragraph, text: str, is_contact_line: bool = False) -> None:
     """Add text with markdown formatting (bold, italic, links)."""
-    base_size = Pt(10) if is_contact_line else Pt(10.5)
+    base_size = PT_10 if is_contact_line else PT_10_5
     base_color = TEXT_MUTED if is_contact_line else TEXT_PRIMARY
 
-    # Named groups: bold_italic, bold, italic, link_text, link_url, plain
-    pattern = (
-        r"(?:\*\*\*(?P<bold_italic>.+?)\*\*\*)"
-        r"|(?:\*\*(?P<bold>.+?)\*\*)"
-        r"|(?:\*(?P<italic>.+?)\*)"
-        r"|(?:\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\))"
-        r"|(?P<plain>[^*\[]+)"
-    )
-
-    for m in re.finditer(pattern, text):
-        if m.group("bold_italic"):
-            run = paragraph.add_run(m.group("bold_italic"))
-            run.bold, run.italic = True, True
-            run.font.color.rgb = TEXT_PRIMARY
-        elif m.group("bold"):
-            run = paragraph.add_run(m.group("bold"))
+    add_run = paragraph.add_run
+
+    # Exactly one alternative matches, so lastgroup names it in a single
+    # lookup (a link's last group is link_url)
+    for m in _INLINE_FINDITER(text):
+        kind = m.lastgroup
+        size = base_size
+        if kind == "plain":
+            run = add_run(m.group("plain"))
+            color = base_color
+        elif kind == "bold":
+            run = add_run(m.group("bold"))
             run.bold = True
-            run.font.color.rgb = TEXT_PRIMARY
-        elif m.group("italic"):
-            run = paragraph.add_run(m.group("italic"))
+            color = TEXT_PRIMARY
+        elif kind == "italic":
+            run = add_run(m.group("italic"))
             run.italic = True
-            run.font.color.rgb = TEXT_MUTED
-            run.font.name = FONT_FAMILY
-            run.font.size = Pt(10)  # Italic uses fixed 10pt
-            continue
-        elif m.group("link_text"):
-            run = paragraph.add_run(m.group("link_text"))
-            run.font.color.rgb = LINK_BLUE
-        elif m.group("plain"):
-            run = paragraph.add_run(m.group("plain"))
-            run.font.color.rgb = base_color
+            color = TEXT_MUTED
+            size = PT_10  # Italic uses fixed 10pt
+        elif kind == "bold_italic":
+            run = add_run(m.group("bold_italic"))
+            run.bold, run.italic = True, True
+            color = TEXT_PRIMARY
+        elif kind == "link_url":
+            run = add_run(m.group("link_text"))
+            color = LINK_BLUE
         else:
             continue
 
-        run.font.name = FONT_FAMILY
-        run.font.size = base_size
+        # run.font builds a new proxy on each access; fetch it once
+        font = run.font
+        font.color.rgb = color
+        font.name = FONT_FAMILY
+        font.size = size
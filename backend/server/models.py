@@ -1,23 +1,65 @@
 """Pydantic models for job_search data structures."""
 
-from datetime import datetime
-from typing import Optional
+import sys
+from datetime import datetime, timezone
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field, model_validator
+from pydantic.dataclasses import dataclass
+
+
+_UTC = timezone.utc
+_NOW = datetime.now
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with a Z suffix, e.g. 2025-01-01T12:00:00.000000Z."""
+    return _NOW(_UTC).isoformat(timespec="microseconds")[:-6] + "Z"
+
+
+class _Model(BaseModel):
+    """Base for all job_search models.
+
+    Schema build is deferred until a model is first validated or
+    serialized, so importing this module doesn't pay for models (or
+    nested sub-models) a given process never touches.
+    """
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
+
+def _intern(v):
+    """Share one string object per distinct value of a small-vocabulary field."""
+    return sys.intern(v) if isinstance(v, str) else v
+
+
+# Fields like source/level/sentiment repeat a handful of values across every
+# instance. Loads via model_validate_json already dedupe through pydantic-core's
+# string cache; this covers models built from Python dicts and kwargs.
+Vocab = Annotated[str, BeforeValidator(_intern)]
+
+
+# Workflow values the API accepts. Only request models use these Literals, so
+# a bad value is a 422 at the boundary; stored fields stay plain str so legacy
+# values load, and survive rewrites of the file, unchanged.
+Priority = Literal["high", "medium", "low"]
+Stage = Literal["select", "deep_dive", "application"]
+Verdict = Literal["Pursue", "Maybe", "Skip"]
+DeepDiveStatus = Literal["pending", "complete"]
+SelectionSource = Literal["claude", "user"]
 
 
 # --- Job Models ---
 
 
-class Job(BaseModel):
+class Job(_Model):
     job_id: str
     title: str
     company: str
     location: Optional[str] = None
     salary: Optional[str] = None
     url: str
-    source: str
-    level: Optional[str] = None
+    source: Vocab
+    level: Optional[Vocab] = None
     ai_focus: bool = False
     posted: Optional[str] = None
     days_ago: Optional[int] = None
@@ -34,17 +76,17 @@ class Job(BaseModel):
     jd_scraped_at: Optional[str] = None
 
 
-class SearchParams(BaseModel):
+class SearchParams(_Model):
     query: str
     location: Optional[str] = None
     days: Optional[int] = None
     sites: list[str] = Field(default_factory=lambda: ["indeed"])
     n: int = 10
     remote: Optional[bool] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    timestamp: str = Field(default_factory=_utc_now_iso)
 
 
-class SearchResults(BaseModel):
+class SearchResults(_Model):
     search_params: SearchParams
     jobs: list[Job] = Field(default_factory=list)
 
@@ -52,28 +94,63 @@ class SearchResults(BaseModel):
 # --- Selection Models ---
 
 
-class Selection(BaseModel):
+class Selection(_Model):
     job_id: str
     source: str  # "claude" or "user"
 
 
-class Selections(BaseModel):
+class Selections(_Model):
     selections: list[Selection] = Field(default_factory=list)
-    # Legacy field for backward compatibility
-    selected_ids: list[str] = Field(default_factory=list)
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    updated_at: str = Field(default_factory=_utc_now_iso)
+
+    @model_validator(mode="before")
+    @classmethod
+    def fold_legacy_selected_ids(cls, data):
+        """Turn legacy selected_ids not already in selections into user selections."""
+        if not isinstance(data, dict) or not data.get("selected_ids"):
+            return data
+        data = dict(data)
+        selections = list(data.get("selections") or [])
+        seen = {s["job_id"] if isinstance(s, dict) else s.job_id for s in selections}
+        for job_id in data.pop("selected_ids"):
+            if job_id not in seen:
+                selections.append({"job_id": job_id, "source": "user"})
+                seen.add(job_id)
+        data["selections"] = selections
+        return data
+
+    # Legacy field for backward compatibility, derived rather than stored
+    @computed_field
+    @property
+    def selected_ids(self) -> list[str]:
+        return [s.job_id for s in self.selections]
 
 
 # --- Research Models ---
 
 
-class ResearchItem(BaseModel):
+class ResearchItem(_Model):
     """A factual finding with source link and sentiment."""
+    model_config = ConfigDict(frozen=True)
+
     finding: str  # The fact with markdown link
-    sentiment: str = "neutral"  # "positive" | "negative" | "neutral"
+    sentiment: Vocab = "neutral"  # "positive" | "negative" | "neutral"
+
+
+def _coerce_list(v):
+    """Handle legacy None values and plain strings."""
+    if v is None or isinstance(v, str):
+        return []  # Can't convert plain string to itemized format
+    return v
+
 
+ResearchItems = Annotated[list[ResearchItem], BeforeValidator(_coerce_list)]
 
-class CompanyResearch(BaseModel):
+
+# Flat leaf containers with no validators are slotted pydantic dataclasses:
+# still validated when nested in a model, but no per-instance __dict__.
+@dataclass(slots=True, kw_only=True)
+class CompanyResearch:
     size: Optional[str] = None
     funding: Optional[str] = None
     stage: Optional[str] = None
@@ -81,52 +158,34 @@ class CompanyResearch(BaseModel):
     market: Optional[str] = None
 
 
-class RoleResearch(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class RoleResearch:
     scope: Optional[str] = None
     team: Optional[str] = None
     tech_stack: Optional[str] = None
 
 
-class SentimentResearch(BaseModel):
+class SentimentResearch(_Model):
     """Employee and customer sentiment with itemized findings."""
-    employee: list[ResearchItem] = Field(default_factory=list)  # Glassdoor, Blind
-    customer: list[ResearchItem] = Field(default_factory=list)  # G2, TrustRadius, Reddit
-
-    @field_validator("employee", "customer", mode="before")
-    @classmethod
-    def coerce_none_to_list(cls, v):
-        """Handle legacy None values and plain strings."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return []  # Can't convert plain string to itemized format
-        return v
+    employee: ResearchItems = Field(default_factory=list)  # Glassdoor, Blind
+    customer: ResearchItems = Field(default_factory=list)  # G2, TrustRadius, Reddit
 
 
-class ContextResearch(BaseModel):
+class ContextResearch(_Model):
     """Market context, interview process, and remote reality findings."""
-    market: list[ResearchItem] = Field(default_factory=list)  # Competitors, news
-    interview_process: list[ResearchItem] = Field(default_factory=list)  # Glassdoor interviews
-    remote_reality: list[ResearchItem] = Field(default_factory=list)  # Actual remote policy
+    market: ResearchItems = Field(default_factory=list)  # Competitors, news
+    interview_process: ResearchItems = Field(default_factory=list)  # Glassdoor interviews
+    remote_reality: ResearchItems = Field(default_factory=list)  # Actual remote policy
 
-    @field_validator("market", "interview_process", "remote_reality", mode="before")
-    @classmethod
-    def coerce_none_to_list(cls, v):
-        """Handle legacy None values and plain strings."""
-        if v is None:
-            return []
-        if isinstance(v, str):
-            return []  # Can't convert plain string to itemized format
-        return v
 
-
-class CompensationResearch(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CompensationResearch:
     found: bool = False
     estimate: Optional[str] = None
     notes: Optional[str] = None
 
 
-class Research(BaseModel):
+class Research(_Model):
     company: CompanyResearch = Field(default_factory=CompanyResearch)
     role: RoleResearch = Field(default_factory=RoleResearch)
     sentiment: SentimentResearch = Field(default_factory=SentimentResearch)
@@ -134,53 +193,51 @@ class Research(BaseModel):
     compensation: CompensationResearch = Field(default_factory=CompensationResearch)
 
 
-class ResearchNotes(BaseModel):
+class ResearchNotes(_Model):
     """Structured research findings categorized by source type."""
-    employee: list[ResearchItem] = Field(default_factory=list)  # Glassdoor, Blind, LinkedIn
-    customer: list[ResearchItem] = Field(default_factory=list)  # Reddit, G2, Trustpilot
-    company: list[ResearchItem] = Field(default_factory=list)   # Crunchbase, news, funding
-
-    @field_validator("employee", "customer", "company", mode="before")
-    @classmethod
-    def coerce_none_to_list(cls, v):
-        """Handle legacy None values."""
-        if v is None:
-            return []
-        return v
+    employee: ResearchItems = Field(default_factory=list)  # Glassdoor, Blind, LinkedIn
+    customer: ResearchItems = Field(default_factory=list)  # Reddit, G2, Trustpilot
+    company: ResearchItems = Field(default_factory=list)   # Crunchbase, news, funding
 
 
 # --- Job Description and Enhanced Insights ---
 
 
-class JobDescription(BaseModel):
+class JobDescription(_Model):
     """Scraped job description with metadata."""
     raw_text: str
     scraped_at: str  # ISO timestamp
     source_url: str
-    scrape_status: str = "complete"  # "complete" | "partial" | "failed" | "manual"
+    scrape_status: Vocab = "complete"  # "complete" | "partial" | "failed" | "manual"
 
 
-class AlignmentItem(BaseModel):
+class AlignmentItem(_Model):
     """A JD requirement with matching evidence from profile."""
+    model_config = ConfigDict(frozen=True)
+
     requirement: str
     evidence: str
-    strength: str  # "strong" | "partial" | "weak"
+    strength: Vocab  # "strong" | "partial" | "weak"
 
 
-class ConcernItem(BaseModel):
+class ConcernItem(_Model):
     """A JD requirement where there's a gap."""
+    model_config = ConfigDict(frozen=True)
+
     requirement: str
     gap: str
     mitigation: Optional[str] = None
 
 
-class MissingRequirement(BaseModel):
+class MissingRequirement(_Model):
     """A JD requirement that cannot be met."""
+    model_config = ConfigDict(frozen=True)
+
     requirement: str
     assessment: str
 
 
-class EnhancedInsights(BaseModel):
+class EnhancedInsights(_Model):
     """Evidence-based insights derived from JD analysis."""
     alignment: list[AlignmentItem] = Field(default_factory=list)
     concerns: list[ConcernItem] = Field(default_factory=list)
@@ -188,7 +245,7 @@ class EnhancedInsights(BaseModel):
 
 
 # Legacy insights model for backward compatibility
-class Insights(BaseModel):
+class Insights(_Model):
     comparison: Optional[str] = None
     posting_analysis: Optional[str] = None
     market_context: Optional[str] = None
@@ -197,21 +254,22 @@ class Insights(BaseModel):
 # --- Conclusions and Recommendations ---
 
 
-class DealbreakersCheck(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class DealbreakersCheck:
     matrix_coordination: bool = False
     leadership_disguised: bool = False
     advisory_role: bool = False
 
 
-class Conclusions(BaseModel):
-    fit_score: Optional[int] = None
+class Conclusions(_Model):
+    fit_score: Optional[int] = None  # 1-10 scale, range-checked on requests in routes
     fit_explanation: Optional[str] = None
     concerns: list[str] = Field(default_factory=list)
     attractions: list[str] = Field(default_factory=list)
     dealbreaker_check: DealbreakersCheck = Field(default_factory=DealbreakersCheck)
 
 
-class Recommendations(BaseModel):
+class Recommendations(_Model):
     verdict: Optional[str] = None  # "Pursue", "Maybe", "Skip"
     questions_to_ask: list[str] = Field(default_factory=list)
     next_steps: list[str] = Field(default_factory=list)
@@ -220,11 +278,11 @@ class Recommendations(BaseModel):
 # --- Deep Dive Models ---
 
 
-class DeepDive(BaseModel):
+class DeepDive(_Model):
     job_id: str
     status: str = "pending"  # "pending", "complete"
     archived: bool = False
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    updated_at: str = Field(default_factory=_utc_now_iso)
     research: Research = Field(default_factory=Research)
     research_notes: Optional[ResearchNotes] = None  # Structured findings with sources
     jd: Optional[JobDescription] = None  # Scraped job description
@@ -234,19 +292,21 @@ class DeepDive(BaseModel):
     recommendations: Recommendations = Field(default_factory=Recommendations)
 
 
-class DeepDives(BaseModel):
+class DeepDives(_Model):
     deep_dives: list[DeepDive] = Field(default_factory=list)
 
 
 # --- Note Models ---
 
 
-class Note(BaseModel):
+class Note(_Model):
+    model_config = ConfigDict(frozen=True)
+
     note_id: str
     job_id: str
     text: str
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    created_at: str = Field(default_factory=_utc_now_iso)
 
 
-class Notes(BaseModel):
+class Notes(_Model):
     notes: list[Note] = Field(default_factory=list)
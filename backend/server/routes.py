@@ -4,13 +4,17 @@ For complete API documentation including data structures, error codes,
 and response formats, see: references/api.md
 """
 
-import json
-from datetime import datetime
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
 
 from scripts.linkedin_auth import check_auth_status, do_login as linkedin_login
 from scripts.linkedin_search import search_linkedin as do_search, get_search_results as get_cached_search, scrape_top_picks as do_top_picks
@@ -23,18 +27,22 @@ from scripts.euremotejobs_search import search_euremotejobs as do_search_euremot
 from scripts.euremotejobs_jd import scrape_jd as do_scrape_jd_er, scrape_jds as do_scrape_jds_er
 from server.utils import generate_job_id, categorize_level, has_ai_focus, compute_days_ago, is_stale, normalize_job_id
 from server.data import (
-    get_results, save_results, SearchResults, SearchParams, Job as DataJob,
+    get_results, save_results, SearchResults, Job as DataJob,
     save_selections, Selections,
     select_jobs as data_select_jobs, deselect_jobs as data_deselect_jobs,
     get_selections_by_source,
-    get_deep_dives, get_deep_dive_by_id, save_deep_dive, DeepDive, DeepDives,
+    get_deep_dives, get_deep_dives_json, get_deep_dive_by_id, save_deep_dive, DeepDive, DeepDives,
     remove_jobs as data_remove_jobs, remove_deep_dives, update_job as data_update_job,
-    delete_deep_dive, archive_deep_dives, unarchive_deep_dives,
+    update_jobs as data_update_jobs,
+    delete_deep_dive, delete_deep_dives, archive_deep_dives, unarchive_deep_dives,
     Research, Insights, Conclusions, Recommendations, ResearchNotes,
-    _write_json, DEEP_DIVES_FILE, JobNotFoundError,
+    JobDescription, EnhancedInsights,
+    _write_model, _utc_now_iso, DEEP_DIVES_FILE, JobNotFoundError,
     get_notes as data_get_notes, add_note as data_add_note, remove_note as data_remove_note,
-    get_jobs_by_ids, find_company_research,
+    get_job_by_id, get_jobs_by_ids, find_company_research, batch_writes,
+    title_company_key, get_existing_job_keys,
 )
+from server.models import DeepDiveStatus, Priority, SelectionSource, Stage, Verdict
 from server.websocket import (
     broadcast_jobs_updated,
     broadcast_deep_dive_updated,
@@ -44,20 +52,42 @@ from server.websocket import (
 
 router = APIRouter(prefix="/api")
 
+# Validates a batch of new jobs in a single pydantic-core call
+_JOB_LIST = TypeAdapter(list[DataJob])
+
+_INF = float("inf")
+
+
+def _sort_key(job: DataJob) -> float:
+    """Manual sort_order, with unordered jobs (None) last."""
+    so = job.sort_order
+    return _INF if so is None else so
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core.
+
+    Returning it skips FastAPI's jsonable_encoder walk. Content may mix plain
+    dicts/lists with models, which serialize in Rust directly to bytes.
+    """
+
+    def render(self, content) -> bytes:
+        return to_json(content)
+
 
 # --- Slim Serializers (for Claude Desktop token efficiency) ---
 
 
-def serialize_job_slim(job_data: dict, dive: "DeepDive | None") -> dict:
+def serialize_job_slim(job: DataJob, dive: "DeepDive | None") -> dict:
     """Flat, minimal job representation for tool responses."""
     result = {
-        "job_id": job_data["job_id"],
-        "title": job_data["title"],
-        "company": job_data["company"],
-        "loc": job_data.get("location") or "",
-        "level": job_data.get("level") or "other",
-        "ai": job_data.get("ai_focus", False),
-        "has_jd": bool(job_data.get("jd_text")),
+        "job_id": job.job_id,
+        "title": job.title,
+        "company": job.company,
+        "loc": job.location or "",
+        "level": job.level or "other",
+        "ai": job.ai_focus,
+        "has_jd": bool(job.jd_text),
     }
     if dive:
         result["verdict"] = dive.recommendations.verdict if dive.recommendations else None
@@ -66,13 +96,16 @@ def serialize_job_slim(job_data: dict, dive: "DeepDive | None") -> dict:
     return result
 
 
-def serialize_dive_slim(dive: "DeepDive", job_lookup: dict) -> dict:
-    """Flat, minimal deep dive representation."""
-    job = job_lookup.get(dive.job_id, {})
+def serialize_dive_slim(dive: "DeepDive", job_lookup: dict[str, tuple[str, str]]) -> dict:
+    """Flat, minimal deep dive representation.
+
+    job_lookup maps job_id -> (company, title).
+    """
+    company, title = job_lookup.get(dive.job_id, ("", ""))
     result = {
         "job_id": dive.job_id,
-        "company": job.get("company", ""),
-        "title": job.get("title", ""),
+        "company": company,
+        "title": title,
         "status": dive.status,
     }
     if dive.recommendations:
@@ -94,8 +127,18 @@ class SelectionsRequest(BaseModel):
     selected_ids: list[str]
 
 
+class JobPayload(BaseModel):
+    """Incoming job for push/ingest: free-form, but workflow fields must be valid."""
+    model_config = ConfigDict(extra="allow")
+
+    days_ago: Optional[int] = Field(default=None, ge=0)
+    priority: Optional[Priority] = None
+    stage: Optional[Stage] = None
+    verdict: Optional[Verdict] = None
+
+
 class PushJobsRequest(BaseModel):
-    jobs: list[dict]
+    jobs: list[JobPayload]
     search_params: Optional[dict] = None
 
 
@@ -114,24 +157,31 @@ class UpdateJobRequest(BaseModel):
     level: Optional[str] = None
     ai_focus: Optional[bool] = None
     posted: Optional[str] = None
-    days_ago: Optional[int] = None
-    priority: Optional[str] = None
-    stage: Optional[str] = None
-    verdict: Optional[str] = None
+    days_ago: Optional[int] = Field(default=None, ge=0)
+    priority: Optional[Priority] = None
+    stage: Optional[Stage] = None
+    verdict: Optional[Verdict] = None
     archived: Optional[bool] = None
 
 
 class IngestJobsRequest(BaseModel):
-    jobs: list[dict]
+    jobs: list[JobPayload]
     dedupe_by: str = "job_id"  # "job_id", "title_company", "none"
 
 
+class ConclusionsPayload(BaseModel):
+    """Deep-dive conclusions as sent by a client; fit_score must be on the 0-10 scale."""
+    model_config = ConfigDict(extra="allow")
+
+    fit_score: Optional[int] = Field(default=None, ge=0, le=10)
+
+
 class DeepDiveRequest(BaseModel):
     job_id: str
     research: dict = Field(default_factory=dict)
     research_notes: Optional[dict] = None  # Structured findings with sources
     insights: dict = Field(default_factory=dict)
-    conclusions: dict = Field(default_factory=dict)
+    conclusions: ConclusionsPayload = Field(default_factory=ConclusionsPayload)
     recommendations: dict = Field(default_factory=dict)
 
 
@@ -145,127 +195,151 @@ def get_jobs(ids: Optional[str] = None, include_archived: bool = False, slim: bo
     Args:
         slim: If True, return flat minimal response for tool calls (no jd_text, no nested deep_dive).
     """
-    results = get_results()
-    jobs = results.jobs
+    jobs = get_results().jobs
+    id_set = {i.strip() for i in ids.split(",")} if ids else None
 
-    # Filter archived unless explicitly included
-    if not include_archived:
-        jobs = [j for j in jobs if not j.archived]
-
-    if ids:
-        id_list = [i.strip() for i in ids.split(",")]
-        jobs = [j for j in jobs if j.job_id in id_list]
+    # Filter archived (unless explicitly included) and by ids in one pass
+    if id_set is not None or not include_archived:
+        jobs = [
+            j for j in jobs
+            if (include_archived or not j.archived) and (id_set is None or j.job_id in id_set)
+        ]
 
     # Build deep_dive lookup for efficient joining
     dives = get_deep_dives()
     dive_lookup = {d.job_id: d for d in dives.deep_dives}
 
+    # Sort by sort_order (None values go to end)
+    jobs = sorted(jobs, key=_sort_key)
+    dive_get = dive_lookup.get
+
     # Slim mode: flat minimal response
     if slim:
-        jobs_out = []
-        for job in jobs:
-            dive = dive_lookup.get(job.job_id)
-            jobs_out.append(serialize_job_slim(job.model_dump(), dive))
-        jobs_out.sort(key=lambda j: (j.get("sort_order") is None, j.get("sort_order") or 0))
-        return {"status": "ok", "jobs": jobs_out, "total": len(jobs_out)}
-
-    # Full mode: join deep_dive data to each job
+        jobs_out = [serialize_job_slim(job, dive_get(job.job_id)) for job in jobs]
+        return ModelJSONResponse({"status": "ok", "jobs": jobs_out, "total": len(jobs_out)})
+
+    # Full mode: join deep_dive data to each job in one pass. The dive model
+    # is embedded as-is; ModelJSONResponse serializes it without a dump.
     jobs_with_dives = []
+    # Jobs scraped together share posted/ingested strings: date math once per value
+    days_cache: dict[str, Optional[int]] = {}
+    stale_cache: dict[tuple, bool] = {}
     for job in jobs:
+        posted = job.posted
         job_data = job.model_dump()
         # Compute days_ago dynamically from posted date
-        if job_data.get("posted"):
-            job_data["days_ago"] = compute_days_ago(job_data["posted"])
-        # Compute staleness
-        job_data["stale"] = is_stale(job_data.get("posted"), job_data.get("ingested_at"))
-        dive = dive_lookup.get(job.job_id)
-        job_data["deep_dive"] = dive.model_dump() if dive else None
+        if posted:
+            if posted not in days_cache:
+                days_cache[posted] = compute_days_ago(posted)
+            job_data["days_ago"] = days_cache[posted]
+        stale_key = (posted, job.ingested_at)
+        if stale_key not in stale_cache:
+            stale_cache[stale_key] = is_stale(posted, job.ingested_at)
+        job_data["stale"] = stale_cache[stale_key]
+        job_data["deep_dive"] = dive_get(job.job_id)
         jobs_with_dives.append(job_data)
 
-    # Sort by sort_order (None values go to end)
-    jobs_with_dives.sort(key=lambda j: (j.get("sort_order") is None, j.get("sort_order") or 0))
-
-    return {"status": "ok", "jobs": jobs_with_dives, "total": len(jobs_with_dives)}
+    return ModelJSONResponse({"status": "ok", "jobs": jobs_with_dives, "total": len(jobs_with_dives)})
 
 
 @router.get("/jobs/{job_id}")
 def get_job(job_id: str):
     """Get a single job by ID, with deep_dive data joined if exists."""
     job_id = normalize_job_id(job_id)
-    results = get_results()
-    job = next((j for j in results.jobs if j.job_id == job_id), None)
+    job = get_job_by_id(job_id)
     if not job:
         return {"status": "error", "error": "Job not found", "code": "JOB_NOT_FOUND"}
 
     # Join deep_dive data from separate file
     job_data = job.model_dump()
     # Compute days_ago dynamically from posted date
-    if job_data.get("posted"):
-        job_data["days_ago"] = compute_days_ago(job_data["posted"])
-    # Compute staleness
-    job_data["stale"] = is_stale(job_data.get("posted"), job_data.get("ingested_at"))
-    deep_dive = get_deep_dive_by_id(job_id)
-    job_data["deep_dive"] = deep_dive.model_dump() if deep_dive else None
+    if job.posted:
+        job_data["days_ago"] = compute_days_ago(job.posted)
+    job_data["stale"] = is_stale(job.posted, job.ingested_at)
+    job_data["deep_dive"] = get_deep_dive_by_id(job_id)
+
+    return ModelJSONResponse({"status": "ok", "job": job_data})
 
-    return {"status": "ok", "job": job_data}
+
+def _new_job_data(j: dict, ingested_at: str, job_id: Optional[str] = None) -> dict:
+    """Field dict for a board job built from an incoming job payload.
+
+    Derived fields (ID, level, AI focus, days_ago) are only computed when the
+    payload doesn't supply them.
+    """
+    title = j.get("title", "")
+    posted = j.get("posted")
+    if job_id is None:
+        job_id = j["job_id"] if "job_id" in j else generate_job_id(j.get("url", ""), title, j.get("company", ""))
+    return {
+        "job_id": job_id,
+        "title": title,
+        "company": j.get("company", ""),
+        "location": j.get("location"),
+        "salary": j.get("salary"),
+        "url": j.get("url", ""),
+        "source": j.get("source", "unknown"),
+        "level": j.get("level") or categorize_level(title),
+        "ai_focus": j["ai_focus"] if j.get("ai_focus") is not None else has_ai_focus(title),
+        "posted": posted,
+        "days_ago": j["days_ago"] if j.get("days_ago") is not None else compute_days_ago(posted),
+        # Workflow fields
+        "priority": j.get("priority"),
+        "stage": j.get("stage"),
+        "verdict": j.get("verdict"),
+        "archived": j.get("archived", False),
+        "sort_order": j.get("sort_order"),
+        # JD fields
+        "jd_text": j.get("jd_text"),
+        "jd_scraped_at": j.get("jd_scraped_at"),
+        # Ingest tracking
+        "ingested_at": ingested_at,
+    }
+
+
+def _board_with(results: SearchResults, url_updates: dict[str, str], new_jobs: list[dict]) -> SearchResults:
+    """Copy of the board with URL updates applied and new jobs appended.
+
+    get_results() returns the shared cached model, so edits go into a copy:
+    if validating new_jobs fails, the cache still matches the file.
+    """
+    jobs = [
+        j.model_copy(update={"url": url_updates[j.job_id]}) if j.job_id in url_updates else j
+        for j in results.jobs
+    ]
+    jobs.extend(_JOB_LIST.validate_python(new_jobs))
+    return results.model_copy(update={"jobs": jobs})
 
 
 @router.post("/jobs")
 def push_jobs(req: PushJobsRequest):
     """Push curated job list to UI (replaces existing jobs)."""
     try:
+        # Validate the whole list in one pass before touching any state
+        now = _utc_now_iso()  # One timestamp for the whole push
+        params = req.search_params or {}
+        jobs = [j.model_dump() for j in req.jobs]
+        results = SearchResults.model_validate({
+            "search_params": {
+                "query": params.get("query", "curated"),
+                "location": params.get("location"),
+                "days": params.get("days"),
+                "sites": params.get("sites", []),
+                "n": len(jobs),
+                "remote": params.get("remote"),
+                "timestamp": now,
+            },
+            "jobs": [_new_job_data(j, j.get("ingested_at") or now) for j in jobs],
+        })
+
         # Clear dependent state since we're replacing the job list
         # (selections and deep dives reference job IDs that won't exist)
-        save_selections(Selections(selected_ids=[]))
-        _write_json(DEEP_DIVES_FILE, DeepDives().model_dump())
-
-        # Convert job dicts to DataJob models
-        jobs = []
-        for j in req.jobs:
-            posted = j.get("posted")
-            jobs.append(DataJob(
-                job_id=j.get("job_id", generate_job_id(j.get("url", ""), j.get("title", ""), j.get("company", ""))),
-                title=j.get("title", ""),
-                company=j.get("company", ""),
-                location=j.get("location"),
-                salary=j.get("salary"),
-                url=j.get("url", ""),
-                source=j.get("source", "unknown"),
-                level=j.get("level") or categorize_level(j.get("title", "")),
-                ai_focus=j.get("ai_focus") if j.get("ai_focus") is not None else has_ai_focus(j.get("title", "")),
-                posted=posted,
-                days_ago=j.get("days_ago") if j.get("days_ago") is not None else compute_days_ago(posted),
-                # Workflow fields
-                priority=j.get("priority"),
-                stage=j.get("stage"),
-                verdict=j.get("verdict"),
-                archived=j.get("archived", False),
-                sort_order=j.get("sort_order"),
-                # JD fields
-                jd_text=j.get("jd_text"),
-                jd_scraped_at=j.get("jd_scraped_at"),
-                # Ingest tracking
-                ingested_at=j.get("ingested_at") or datetime.utcnow().isoformat() + "Z",
-            ))
-
-        # Build search params from request or defaults
-        params = req.search_params or {}
-        results = SearchResults(
-            search_params=SearchParams(
-                query=params.get("query", "curated"),
-                location=params.get("location"),
-                days=params.get("days"),
-                sites=params.get("sites", []),
-                n=len(jobs),
-                remote=params.get("remote"),
-                timestamp=datetime.utcnow().isoformat() + "Z",
-            ),
-            jobs=jobs,
-        )
+        save_selections(Selections())
+        _write_model(DEEP_DIVES_FILE, DeepDives())
         save_results(results)
         broadcast_jobs_updated()
 
-        return {"status": "ok", "job_count": len(jobs)}
+        return {"status": "ok", "job_count": len(results.jobs)}
 
     except Exception as e:
         return {"status": "error", "error": str(e), "code": "INTERNAL_ERROR"}
@@ -283,37 +357,35 @@ def ingest_jobs(req: IngestJobsRequest):
         if req.dedupe_by == "job_id":
             existing_keys = set(existing_jobs.keys())
         elif req.dedupe_by == "title_company":
-            existing_keys = {
-                f"{j.title.lower().strip()}:{j.company.lower().strip()}"
-                for j in existing.jobs
-            }
+            existing_keys = set(get_existing_job_keys()[1])
 
         added = []
         skipped = []
-        urls_updated = False
+        url_updates: dict[str, str] = {}
+        now = _utc_now_iso()  # One timestamp for the whole batch
 
-        for j in req.jobs:
-            # Generate ID if not provided
-            job_id = j.get("job_id", generate_job_id(
-                j.get("url", ""), j.get("title", ""), j.get("company", "")
-            ))
+        dedupe_by = req.dedupe_by
+        for j in (job.model_dump() for job in req.jobs):
+            title = j.get("title", "")
+            company = j.get("company", "")
+            # Generate ID if not provided (only then: hashing every job is wasted work)
+            job_id = j["job_id"] if "job_id" in j else generate_job_id(j.get("url", ""), title, company)
 
             # Check for duplicates based on strategy
-            if req.dedupe_by == "job_id":
+            if dedupe_by == "job_id":
                 dedupe_key = job_id
-            elif req.dedupe_by == "title_company":
-                dedupe_key = f"{j.get('title', '').lower().strip()}:{j.get('company', '').lower().strip()}"
+            elif dedupe_by == "title_company":
+                dedupe_key = title_company_key(title, company)
             else:
                 dedupe_key = None  # No deduplication
 
             if dedupe_key and dedupe_key in existing_keys:
                 # Update URL if we have a better one (e.g., with slug)
-                if req.dedupe_by == "job_id" and job_id in existing_jobs:
+                if dedupe_by == "job_id" and job_id in existing_jobs:
                     new_url = j.get("url", "")
-                    old_url = existing_jobs[job_id].url or ""
+                    old_url = url_updates.get(job_id) or existing_jobs[job_id].url or ""
                     if new_url and len(new_url) > len(old_url):
-                        existing_jobs[job_id].url = new_url
-                        urls_updated = True
+                        url_updates[job_id] = new_url
                 skipped.append({"job_id": job_id, "reason": "duplicate"})
                 continue
 
@@ -321,38 +393,11 @@ def ingest_jobs(req: IngestJobsRequest):
             if dedupe_key:
                 existing_keys.add(dedupe_key)
 
-            # Convert to DataJob
-            posted = j.get("posted")
-            new_job = DataJob(
-                job_id=job_id,
-                title=j.get("title", ""),
-                company=j.get("company", ""),
-                location=j.get("location"),
-                salary=j.get("salary"),
-                url=j.get("url", ""),
-                source=j.get("source", "unknown"),
-                level=j.get("level") or categorize_level(j.get("title", "")),
-                ai_focus=j.get("ai_focus") if j.get("ai_focus") is not None else has_ai_focus(j.get("title", "")),
-                posted=posted,
-                days_ago=j.get("days_ago") if j.get("days_ago") is not None else compute_days_ago(posted),
-                # Workflow fields
-                priority=j.get("priority"),
-                stage=j.get("stage"),
-                verdict=j.get("verdict"),
-                archived=j.get("archived", False),
-                sort_order=j.get("sort_order"),
-                # JD fields
-                jd_text=j.get("jd_text"),
-                jd_scraped_at=j.get("jd_scraped_at"),
-                # Ingest tracking
-                ingested_at=datetime.utcnow().isoformat() + "Z",
-            )
-            added.append(new_job)
-
-        # Append new jobs and/or save URL updates
-        if added:
-            existing.jobs.extend(added)
-        if added or urls_updated:
+            added.append(_new_job_data(j, now, job_id))
+
+        # Append new jobs (validated as one batch) and/or save URL updates
+        if added or url_updates:
+            existing = _board_with(existing, url_updates, added)
             save_results(existing)
             broadcast_jobs_updated()
 
@@ -426,7 +471,7 @@ def write_selections(req: SelectionsRequest):
     """Save selections (legacy endpoint)."""
     selections = Selections(
         selected_ids=req.selected_ids,
-        updated_at=datetime.utcnow().isoformat() + "Z",
+        updated_at=_utc_now_iso(),
     )
     save_selections(selections)
     return {"status": "ok"}
@@ -434,7 +479,7 @@ def write_selections(req: SelectionsRequest):
 
 class SelectJobsRequest(BaseModel):
     job_ids: list[str]
-    source: str = "claude"
+    source: SelectionSource = "claude"
 
 
 @router.post("/selections/select")
@@ -467,41 +512,47 @@ def read_deep_dives(include_archived: bool = False, slim: bool = False):
     Args:
         slim: If True, return flat minimal response for tool calls.
     """
+    # Full mode: the serialized body is cached until deep_dives.json changes
+    if not slim:
+        return Response(get_deep_dives_json(include_archived), media_type="application/json")
+
     dives = get_deep_dives()
     if not include_archived:
-        dives.deep_dives = [d for d in dives.deep_dives if not d.archived]
+        # Filter into a new model: get_deep_dives() returns the shared cached one
+        dives = DeepDives.model_construct(deep_dives=[d for d in dives.deep_dives if not d.archived])
 
     # Slim mode: flat minimal response with job context
-    if slim:
-        results = get_results()
-        job_lookup = {j.job_id: j.model_dump() for j in results.jobs}
-        return {
-            "status": "ok",
-            "deep_dives": [serialize_dive_slim(d, job_lookup) for d in dives.deep_dives],
-            "total": len(dives.deep_dives),
-        }
-
-    return dives
+    results = get_results()
+    job_lookup = {j.job_id: (j.company, j.title) for j in results.jobs}
+    return ModelJSONResponse({
+        "status": "ok",
+        "deep_dives": [serialize_dive_slim(d, job_lookup) for d in dives.deep_dives],
+        "total": len(dives.deep_dives),
+    })
 
 
 @router.post("/deep-dives")
 def write_deep_dive(req: DeepDiveRequest):
     """Save a deep dive for a job and set job stage to 'deep_dive'."""
     job_id = normalize_job_id(req.job_id)
-    deep_dive = DeepDive(
-        job_id=job_id,
-        status="complete",
-        updated_at=datetime.utcnow().isoformat() + "Z",
-        research=Research.model_validate(req.research) if req.research else Research(),
-        research_notes=ResearchNotes.model_validate(req.research_notes) if req.research_notes else None,
-        insights=Insights.model_validate(req.insights) if req.insights else Insights(),
-        conclusions=Conclusions.model_validate(req.conclusions) if req.conclusions else Conclusions(),
-        recommendations=Recommendations.model_validate(req.recommendations) if req.recommendations else Recommendations(),
-    )
     try:
-        save_deep_dive(deep_dive)
-        # Also set job stage to 'deep_dive' so UI shows it in Deep Dives view
-        data_update_job(job_id, {"stage": "deep_dive"})
+        deep_dive = DeepDive(
+            job_id=job_id,
+            status="complete",
+            updated_at=_utc_now_iso(),
+            research=Research.model_validate(req.research) if req.research else Research(),
+            research_notes=ResearchNotes.model_validate(req.research_notes) if req.research_notes else None,
+            insights=Insights.model_validate(req.insights) if req.insights else Insights(),
+            conclusions=Conclusions.model_validate(req.conclusions.model_dump(exclude_unset=True)),
+            recommendations=Recommendations.model_validate(req.recommendations) if req.recommendations else Recommendations(),
+        )
+    except ValidationError as e:
+        return {"status": "error", "error": str(e), "code": "INVALID_PARAM"}
+    try:
+        with batch_writes():
+            save_deep_dive(deep_dive)
+            # Also set job stage to 'deep_dive' so UI shows it in Deep Dives view
+            data_update_job(job_id, {"stage": "deep_dive"})
     except JobNotFoundError as e:
         return {"status": "error", "error": str(e), "code": "JOB_NOT_FOUND"}
     broadcast_deep_dive_updated(job_id)
@@ -517,9 +568,9 @@ class DeepDivePatchRequest(BaseModel):
     research: Optional[dict] = None
     research_notes: Optional[dict] = None  # Structured findings with sources
     insights: Optional[dict] = None
-    conclusions: Optional[dict] = None
+    conclusions: Optional[ConclusionsPayload] = None
     recommendations: Optional[dict] = None
-    status: Optional[str] = None
+    status: Optional[DeepDiveStatus] = None
 
 
 @router.patch("/deep-dives/{job_id}")
@@ -530,28 +581,33 @@ def patch_deep_dive(job_id: str, req: DeepDivePatchRequest):
     if not existing:
         return {"status": "error", "error": "Deep dive not found", "code": "DEEP_DIVE_NOT_FOUND"}
 
-    # Merge updates into existing data
-    update_data = existing.model_dump()
-    update_data["updated_at"] = datetime.utcnow().isoformat() + "Z"
-
-    if req.jd is not None:
-        update_data["jd"] = req.jd
-    if req.enhanced_insights is not None:
-        update_data["enhanced_insights"] = req.enhanced_insights
-    if req.research is not None:
-        update_data["research"] = {**update_data.get("research", {}), **req.research}
-    if req.research_notes is not None:
-        update_data["research_notes"] = req.research_notes
-    if req.insights is not None:
-        update_data["insights"] = {**update_data.get("insights", {}), **req.insights}
-    if req.conclusions is not None:
-        update_data["conclusions"] = {**update_data.get("conclusions", {}), **req.conclusions}
-    if req.recommendations is not None:
-        update_data["recommendations"] = {**update_data.get("recommendations", {}), **req.recommendations}
+    # Validate only the patched sections; untouched ones are reused as-is.
+    # Merged sections skip empty dicts, which would merge to the same values.
+    updates = {"updated_at": _utc_now_iso()}
+    conclusions = req.conclusions.model_dump(exclude_unset=True) if req.conclusions else None
+
+    try:
+        if req.jd is not None:
+            updates["jd"] = JobDescription.model_validate(req.jd)
+        if req.enhanced_insights is not None:
+            updates["enhanced_insights"] = EnhancedInsights.model_validate(req.enhanced_insights)
+        if req.research:
+            updates["research"] = Research.model_validate({**existing.research.model_dump(), **req.research})
+        if req.research_notes is not None:
+            updates["research_notes"] = ResearchNotes.model_validate(req.research_notes)
+        if req.insights:
+            updates["insights"] = Insights.model_validate({**existing.insights.model_dump(), **req.insights})
+        if conclusions:
+            updates["conclusions"] = Conclusions.model_validate({**existing.conclusions.model_dump(), **conclusions})
+        if req.recommendations:
+            updates["recommendations"] = Recommendations.model_validate({**existing.recommendations.model_dump(), **req.recommendations})
+    except ValidationError as e:
+        return {"status": "error", "error": str(e), "code": "INVALID_PARAM"}
+
     if req.status is not None:
-        update_data["status"] = req.status
+        updates["status"] = req.status
 
-    updated_dive = DeepDive.model_validate(update_data)
+    updated_dive = existing.model_copy(update=updates)
     try:
         save_deep_dive(updated_dive)
     except JobNotFoundError as e:
@@ -579,13 +635,7 @@ class DeleteDeepDivesRequest(BaseModel):
 def delete_deep_dives_route(req: DeleteDeepDivesRequest):
     """Delete multiple deep dives by job IDs."""
     job_ids = [normalize_job_id(jid) for jid in req.job_ids]
-    deleted = 0
-    not_found = []
-    for job_id in job_ids:
-        if delete_deep_dive(job_id):
-            deleted += 1
-        else:
-            not_found.append(job_id)
+    deleted, not_found = delete_deep_dives(job_ids)
     if deleted > 0:
         broadcast_deep_dives_changed()
     return {"status": "ok", "deleted": deleted, "not_found": not_found}
@@ -627,9 +677,25 @@ def get_company_knowledge(company_name: str):
 # --- Status & Auth Routes ---
 
 
+# GET /status launches a browser to check auth; polls within the TTL reuse
+# the last rendered body. The lock makes a burst of pollers wait for one check.
+_STATUS_TTL = 1.0  # seconds
+_status_cache: dict = {"t": -_INF, "body": b""}
+_status_lock = threading.Lock()
+
+
 @router.get("/status")
 def server_status():
     """Combined health check: server + LinkedIn auth."""
+    with _status_lock:
+        if time.monotonic() - _status_cache["t"] >= _STATUS_TTL:
+            _status_cache["body"] = to_json(_build_status())
+            _status_cache["t"] = time.monotonic()
+        body = _status_cache["body"]
+    return Response(body, media_type="application/json")
+
+
+def _build_status() -> dict:
     auth = check_auth_status()
     result = {
         "status": "ok",
@@ -659,25 +725,14 @@ def login():
 # --- Search Routes ---
 
 
-def _get_existing_job_keys() -> tuple[set[str], set[str]]:
-    """Return (job_ids, title_company_keys) for deduplication."""
-    existing = get_results()
-    job_ids = {j.job_id for j in existing.jobs}
-    title_keys = {f"{j.title.lower().strip()}:{j.company.lower().strip()}" for j in existing.jobs}
-    return job_ids, title_keys
-
-
-def _filter_existing(jobs: list[dict], job_ids: set[str], title_keys: set[str]) -> list[dict]:
+def _filter_existing(jobs: list[dict], job_ids: frozenset[str], title_keys: frozenset[str]) -> list[dict]:
     """Remove jobs that match existing board entries."""
-    result = []
-    for job in jobs:
-        if job.get("job_id") in job_ids:
-            continue
-        key = f"{job.get('title', '').lower().strip()}:{job.get('company', '').lower().strip()}"
-        if key in title_keys:
-            continue
-        result.append(job)
-    return result
+    # The title:company key is only built for jobs that pass the ID check
+    return [
+        job for job in jobs
+        if job.get("job_id") not in job_ids
+        and title_company_key(job.get("title") or "", job.get("company") or "") not in title_keys
+    ]
 
 
 class SearchRequest(BaseModel):
@@ -709,7 +764,7 @@ def search_linkedin(req: SearchRequest):
         ai_only=req.ai_only,
     )
     if req.exclude_existing and result.get("status") == "ok":
-        job_ids, title_keys = _get_existing_job_keys()
+        job_ids, title_keys = get_existing_job_keys()
         original_count = len(result.get("jobs", []))
         result["jobs"] = _filter_existing(result.get("jobs", []), job_ids, title_keys)
         result["excluded_existing"] = original_count - len(result["jobs"])
@@ -740,7 +795,7 @@ def linkedin_top_picks(req: TopPicksRequest):
         ai_only=req.ai_only,
     )
     if req.exclude_existing and result.get("status") == "ok":
-        job_ids, title_keys = _get_existing_job_keys()
+        job_ids, title_keys = get_existing_job_keys()
         original_count = len(result.get("jobs", []))
         result["jobs"] = _filter_existing(result.get("jobs", []), job_ids, title_keys)
         result["excluded_existing"] = original_count - len(result["jobs"])
@@ -776,7 +831,7 @@ def search_jobscz(req: JobsCzSearchRequest):
         ai_only=req.ai_only,
     )
     if req.exclude_existing and result.get("status") == "ok":
-        job_ids, title_keys = _get_existing_job_keys()
+        job_ids, title_keys = get_existing_job_keys()
         original_count = len(result.get("jobs", []))
         result["jobs"] = _filter_existing(result.get("jobs", []), job_ids, title_keys)
         result["excluded_existing"] = original_count - len(result["jobs"])
@@ -813,7 +868,7 @@ def search_startupjobs(req: StartupJobsSearchRequest):
         ai_only=req.ai_only,
     )
     if req.exclude_existing and result.get("status") == "ok":
-        job_ids, title_keys = _get_existing_job_keys()
+        job_ids, title_keys = get_existing_job_keys()
         original_count = len(result.get("jobs", []))
         result["jobs"] = _filter_existing(result.get("jobs", []), job_ids, title_keys)
         result["excluded_existing"] = original_count - len(result["jobs"])
@@ -826,55 +881,72 @@ def search_startupjobs(req: StartupJobsSearchRequest):
 FILTERS_FILE = Path(__file__).parent.parent.parent / "data" / "profile" / "search-filters.json"
 
 
+# (mtime_ns, size) of FILTERS_FILE when last parsed, and the parsed filters
+_filters_cache: dict = {"stamp": None, "filters": {}}
+
+
 def _load_search_filters() -> dict:
-    """Load user's search filters from JSON file."""
-    if FILTERS_FILE.exists():
+    """Load user's search filters from JSON file, re-parsing only when it changes.
+
+    The returned dict is shared between calls; treat it as read-only.
+    """
+    try:
+        st = FILTERS_FILE.stat()
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _filters_cache["stamp"] != stamp:
         try:
-            return json.loads(FILTERS_FILE.read_text())
-        except (json.JSONDecodeError, IOError):
-            pass
-    return {}
+            filters = from_json(FILTERS_FILE.read_bytes())
+        except (ValueError, IOError):
+            filters = {}
+        _filters_cache["stamp"] = stamp
+        _filters_cache["filters"] = filters
+    return _filters_cache["filters"]
+
+
+# Czech job boards are inherently in Czech Republic - bypass location filter
+_CZECH_SOURCES = frozenset({"jobs.cz", "startupjobs.cz"})
+
+
+def _any_substring(terms: list[str]):
+    """Compile terms into one alternation; returns its search, or None if empty."""
+    if not terms:
+        return None
+    return re.compile("|".join(map(re.escape, terms))).search
 
 
 def _apply_hard_filters(jobs: list[dict], filters: dict) -> tuple[list[dict], int]:
     """Apply hard filters from search-filters.json. Returns (filtered_jobs, filtered_count)."""
-    title_must_contain = [t.lower() for t in filters.get("title_must_contain", [])]
-    exclude_levels = [lv.lower() for lv in filters.get("exclude_levels", [])]
-    include_locations = [loc.lower() for loc in filters.get("include_locations", [])]
-    exclude_companies = [c.lower() for c in filters.get("exclude_companies", [])]
+    # One C-level regex scan per job instead of a Python any() over every term
+    title_match = _any_substring([t.lower() for t in filters.get("title_must_contain", [])])
+    location_match = _any_substring([loc.lower() for loc in filters.get("include_locations", [])])
+    exclude_levels = frozenset(lv.lower() for lv in filters.get("exclude_levels", []))
+    exclude_companies = frozenset(c.lower() for c in filters.get("exclude_companies", []))
 
     result = []
     filtered = 0
 
-    # Czech job boards are inherently in Czech Republic - bypass location filter
-    czech_sources = {"jobs.cz", "startupjobs.cz"}
-
     for job in jobs:
-        title = (job.get("title") or "").lower()
-        level = (job.get("level") or "").lower()
-        location = (job.get("location") or "").lower()
-        company = (job.get("company") or "").lower()
-        source = job.get("source") or ""
-
         # Title must contain at least one of the required terms
-        if title_must_contain and not any(term in title for term in title_must_contain):
+        if title_match and not title_match((job.get("title") or "").lower()):
             filtered += 1
             continue
 
         # Exclude certain levels
-        if level in exclude_levels:
+        if (job.get("level") or "").lower() in exclude_levels:
             filtered += 1
             continue
 
         # Location must match at least one allowed location (whitelist)
         # Skip for Czech job boards - they're inherently in Czech Republic
-        if source not in czech_sources:
-            if include_locations and not any(loc in location for loc in include_locations):
+        if location_match and (job.get("source") or "") not in _CZECH_SOURCES:
+            if not location_match((job.get("location") or "").lower()):
                 filtered += 1
                 continue
 
         # Exclude companies (exact match)
-        if company in exclude_companies:
+        if (job.get("company") or "").lower() in exclude_companies:
             filtered += 1
             continue
 
@@ -916,37 +988,47 @@ def unified_search(req: UnifiedSearchRequest):
         "euremotejobs": lambda: do_search_euremotejobs(query=req.query, location=req.location, days=req.days),
     }
 
-    # Search each source
-    for source in req.sources:
+    def search_source(source: str) -> Optional[dict]:
+        """Run one source's search; None if the source is unknown."""
         config_path = scrapers_dir / f"{source}.json"
 
         # Check if config exists and what engine it uses
         use_generic = False
         if config_path.exists():
             try:
-                import json
-                config = json.loads(config_path.read_text())
+                config = from_json(config_path.read_bytes())
                 # engine: "python" means use builtin fallback, not generic scraper
                 use_generic = config.get("engine") != "python"
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 use_generic = True
 
         if use_generic and config_path.exists():
             # Config exists with non-python engine → use generic scraper
             from scripts.generic_search import search_generic
-            result = search_generic(source, query=req.query, location=req.location)
-        elif source in builtin_fallbacks:
+            return search_generic(source, query=req.query, location=req.location)
+        if source in builtin_fallbacks:
             # No config or engine=python → use Python script
-            result = builtin_fallbacks[source]()
-        else:
-            # Unknown source with no config
-            errors.append(f"Unknown source: {source} (no config file)")
-            continue
-
-        if result.get("status") == "error":
-            errors.append(f"{source}: {result.get('error', 'Unknown error')}")
-        else:
-            all_jobs.extend(result.get("jobs", []))
+            return builtin_fallbacks[source]()
+        return None
+
+    # Search all sources concurrently (each is network-bound); results are
+    # collected in request order so dedupe keeps the same winner
+    sources = list(dict.fromkeys(req.sources))
+    with ThreadPoolExecutor(max_workers=max(1, len(sources))) as pool:
+        futures = [(source, pool.submit(search_source, source)) for source in sources]
+        for source, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                errors.append(f"{source}: {e}")
+                continue
+            if result is None:
+                # Unknown source with no config
+                errors.append(f"Unknown source: {source} (no config file)")
+            elif result.get("status") == "error":
+                errors.append(f"{source}: {result.get('error', 'Unknown error')}")
+            else:
+                all_jobs.extend(result.get("jobs", []))
 
     if not all_jobs:
         return {
@@ -968,47 +1050,29 @@ def unified_search(req: UnifiedSearchRequest):
             all_jobs, filtered_count = _apply_hard_filters(all_jobs, filters)
 
     # Dedupe against existing board and update URLs for existing jobs
-    job_ids, title_keys = _get_existing_job_keys()
+    job_ids, title_keys = get_existing_job_keys()
     before_dedupe = len(all_jobs)
 
     # Update URLs for duplicate jobs (e.g., startupjobs URLs now include slug)
     existing = get_results()
     existing_jobs = {j.job_id: j for j in existing.jobs}
-    urls_updated = False
+    url_updates: dict[str, str] = {}
     for j in all_jobs:
         jid = j.get("job_id", "")
         if jid in existing_jobs:
             new_url = j.get("url", "")
-            old_url = existing_jobs[jid].url or ""
+            old_url = url_updates.get(jid) or existing_jobs[jid].url or ""
             if new_url and len(new_url) > len(old_url):
-                existing_jobs[jid].url = new_url
-                urls_updated = True
+                url_updates[jid] = new_url
 
     all_jobs = _filter_existing(all_jobs, job_ids, title_keys)
     duplicates = before_dedupe - len(all_jobs)
 
-    # Auto-ingest remaining jobs
-    added = 0
-    for j in all_jobs:
-        posted = j.get("posted")
-        new_job = DataJob(
-            job_id=j.get("job_id", generate_job_id(j.get("url", ""), j.get("title", ""), j.get("company", ""))),
-            title=j.get("title", ""),
-            company=j.get("company", ""),
-            location=j.get("location"),
-            salary=j.get("salary"),
-            url=j.get("url", ""),
-            source=j.get("source", "unknown"),
-            level=j.get("level") or categorize_level(j.get("title", "")),
-            ai_focus=j.get("ai_focus") if j.get("ai_focus") is not None else has_ai_focus(j.get("title", "")),
-            posted=posted,
-            days_ago=j.get("days_ago") if j.get("days_ago") is not None else compute_days_ago(posted),
-            ingested_at=datetime.utcnow().isoformat() + "Z",
-        )
-        existing.jobs.append(new_job)
-        added += 1
-    if added or urls_updated:
-        save_results(existing)
+    # Auto-ingest remaining jobs, validated as one batch
+    now = _utc_now_iso()  # One timestamp for the whole batch
+    added = len(all_jobs)
+    if added or url_updates:
+        save_results(_board_with(existing, url_updates, [_new_job_data(j, now) for j in all_jobs]))
         broadcast_jobs_updated()
 
     return {
@@ -1046,6 +1110,22 @@ class ScrapeJdsRequest(BaseModel):
     job_ids: list[str]
 
 
+def _persist_scraped_jds(result: dict, with_posted: bool = False) -> None:
+    """Persist every successful JD from a batch scrape in one results write."""
+    updates = {}
+    for item in result.get("results", []):
+        if item.get("jd_text"):
+            update_fields = {
+                "jd_text": item["jd_text"],
+                "jd_scraped_at": item["scraped_at"],
+            }
+            if with_posted and item.get("posted"):
+                update_fields["posted"] = item["posted"]
+            updates[item["job_id"]] = update_fields
+    if updates:
+        data_update_jobs(updates)
+
+
 @router.post("/jd/batch")
 def scrape_jds(req: ScrapeJdsRequest):
     """Batch scrape job descriptions from LinkedIn and persist to job records."""
@@ -1053,15 +1133,7 @@ def scrape_jds(req: ScrapeJdsRequest):
     result = do_scrape_jds(job_ids)
     if result.get("status") == "ok":
         # Persist each successful JD and posting date to job record
-        for item in result.get("results", []):
-            if item.get("jd_text"):
-                update_fields = {
-                    "jd_text": item["jd_text"],
-                    "jd_scraped_at": item["scraped_at"],
-                }
-                if item.get("posted"):
-                    update_fields["posted"] = item["posted"]
-                data_update_job(item["job_id"], update_fields)
+        _persist_scraped_jds(result, with_posted=True)
         broadcast_jobs_updated()
     return result
 
@@ -1099,15 +1171,7 @@ def scrape_jds_cz(req: ScrapeJdsRequest):
     scrape_inputs = [url_map.get(jid, jid) for jid in req.job_ids]
     result = do_scrape_jds_cz(scrape_inputs)
     if result.get("status") == "ok":
-        for item in result.get("results", []):
-            if item.get("jd_text"):
-                update_fields = {
-                    "jd_text": item["jd_text"],
-                    "jd_scraped_at": item["scraped_at"],
-                }
-                if item.get("posted"):
-                    update_fields["posted"] = item["posted"]
-                data_update_job(item["job_id"], update_fields)
+        _persist_scraped_jds(result, with_posted=True)
         broadcast_jobs_updated()
     return result
 
@@ -1141,12 +1205,7 @@ def scrape_jds_sj(req: ScrapeJdsRequest):
     url_map = {j.job_id: j.url for j in jobs}
     result = do_scrape_jds_sj(job_ids, url_map=url_map)
     if result.get("status") == "ok":
-        for item in result.get("results", []):
-            if item.get("jd_text"):
-                data_update_job(item["job_id"], {
-                    "jd_text": item["jd_text"],
-                    "jd_scraped_at": item["scraped_at"],
-                })
+        _persist_scraped_jds(result)
         broadcast_jobs_updated()
     return result
 
@@ -1174,12 +1233,7 @@ def scrape_jds_er(req: ScrapeJdsRequest):
     job_ids = [normalize_job_id(jid) for jid in req.job_ids]
     result = do_scrape_jds_er(job_ids)
     if result.get("status") == "ok":
-        for item in result.get("results", []):
-            if item.get("jd_text"):
-                data_update_job(item["job_id"], {
-                    "jd_text": item["jd_text"],
-                    "jd_scraped_at": item["scraped_at"],
-                })
+        _persist_scraped_jds(result)
         broadcast_jobs_updated()
     return result
 
@@ -1209,12 +1263,7 @@ def scrape_jds_generic(scraper_name: str, req: ScrapeJdsRequest):
     job_ids = [normalize_job_id(jid) for jid in req.job_ids]
     result = do_scrape_jds_generic(scraper_name, job_ids)
     if result.get("status") == "ok":
-        for item in result.get("results", []):
-            if item.get("jd_text"):
-                data_update_job(item["job_id"], {
-                    "jd_text": item["jd_text"],
-                    "jd_scraped_at": item["scraped_at"],
-                })
+        _persist_scraped_jds(result)
         broadcast_jobs_updated()
     return result
 
@@ -1333,15 +1382,9 @@ class ArchiveJobsRequest(BaseModel):
 def archive_jobs(req: ArchiveJobsRequest):
     """Archive jobs (soft delete)."""
     job_ids = [normalize_job_id(jid) for jid in req.job_ids]
-    archived_jobs = []
-    not_found = []
-
-    for job_id in job_ids:
-        updated = data_update_job(job_id, {"archived": True})
-        if updated:
-            archived_jobs.append(updated.model_dump())
-        else:
-            not_found.append(job_id)
+    found = data_update_jobs(dict.fromkeys(job_ids, {"archived": True}))
+    archived_jobs = [found[job_id].model_dump() for job_id in job_ids if job_id in found]
+    not_found = [job_id for job_id in job_ids if job_id not in found]
 
     if archived_jobs:
         broadcast_jobs_updated()
@@ -1357,9 +1400,9 @@ def unarchive_jobs(req: ArchiveJobsRequest):
     not_found = []
     stale_skipped = []
 
-    # Get all jobs to check staleness
-    results = get_results()
-    jobs_by_id = {j.job_id: j for j in results.jobs}
+    # Look up just the requested jobs (via the memoized id index) to check staleness
+    jobs_by_id = {j.job_id: j for j in get_jobs_by_ids(job_ids)}
+    updates = {}
 
     for job_id in job_ids:
         job = jobs_by_id.get(job_id)
@@ -1372,9 +1415,10 @@ def unarchive_jobs(req: ArchiveJobsRequest):
             stale_skipped.append(job_id)
             continue
 
-        updated = data_update_job(job_id, {"archived": False})
-        if updated:
-            unarchived_jobs.append(updated.model_dump())
+        updates[job_id] = {"archived": False}
+
+    if updates:
+        unarchived_jobs = [job.model_dump() for job in data_update_jobs(updates).values()]
 
     if unarchived_jobs:
         broadcast_jobs_updated()
@@ -1396,15 +1440,9 @@ class MarkDeadRequest(BaseModel):
 def mark_jobs_dead(req: MarkDeadRequest):
     """Mark jobs as dead (removed, filled, broken link)."""
     job_ids = [normalize_job_id(jid) for jid in req.job_ids]
-    updated_jobs = []
-    not_found = []
-
-    for job_id in job_ids:
-        updated = data_update_job(job_id, {"dead": True})
-        if updated:
-            updated_jobs.append(job_id)
-        else:
-            not_found.append(job_id)
+    found = data_update_jobs(dict.fromkeys(job_ids, {"dead": True}))
+    updated_jobs = [job_id for job_id in job_ids if job_id in found]
+    not_found = [job_id for job_id in job_ids if job_id not in found]
 
     if updated_jobs:
         broadcast_jobs_updated()
@@ -1420,19 +1458,11 @@ class ReorderJobsRequest(BaseModel):
 def reorder_jobs(req: ReorderJobsRequest):
     """Set manual sort order for jobs."""
     job_ids = [normalize_job_id(jid) for jid in req.job_ids]
-    results = get_results()
-    jobs_by_id = {j.job_id: j for j in results.jobs}
-
-    updated = []
-    not_found = []
 
-    for idx, job_id in enumerate(job_ids):
-        if job_id not in jobs_by_id:
-            not_found.append(job_id)
-            continue
-        job = data_update_job(job_id, {"sort_order": idx})
-        if job:
-            updated.append(job_id)
+    # One bulk update; IDs it didn't find are reported back
+    found = data_update_jobs({job_id: {"sort_order": idx} for idx, job_id in enumerate(job_ids)})
+    updated = [job_id for job_id in job_ids if job_id in found]
+    not_found = [job_id for job_id in job_ids if job_id not in found]
 
     if updated:
         broadcast_jobs_updated()
@@ -1,10 +1,16 @@
 """Shared utility functions for job processing."""
 
 import hashlib
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
+# Short prefixes for each source
+_SHORT_ID_PREFIXES = ("li_", "er_", "cz_", "sj_")
+
+
 def normalize_job_id(job_id: str) -> str:
     """Expand short IDs to full format: li_123 -> job_li_123, etc.
 
@@ -15,10 +21,8 @@ def normalize_job_id(job_id: str) -> str:
         return job_id
     if job_id.startswith("job_"):
         return job_id
-    # Short prefixes for each source
-    for prefix in ("li_", "er_", "cz_", "sj_"):
-        if job_id.startswith(prefix):
-            return "job_" + job_id
+    if job_id.startswith(_SHORT_ID_PREFIXES):
+        return "job_" + job_id
     # Bare numeric assumed to be LinkedIn
     if job_id.isdigit():
         return f"job_li_{job_id}"
@@ -26,9 +30,13 @@ def normalize_job_id(job_id: str) -> str:
 
 
 def generate_job_id(url: str, title: str, company: str) -> str:
-    """Generate stable job ID from content hash."""
+    """Generate stable job ID from content hash.
+
+    MD5 is kept so IDs stay identical to those already stored; it is an
+    identifier, not a security control.
+    """
     content = f"{url}:{title}:{company}"
-    return f"job_{hashlib.md5(content.encode()).hexdigest()[:8]}"
+    return f"job_{hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()[:8]}"
 
 
 def categorize_level(title: str) -> str:
@@ -47,26 +55,40 @@ def categorize_level(title: str) -> str:
     return "other"
 
 
+# AI/ML title keywords as one pattern. "ai" and "ml" must start a word and end
+# it or run into "ops"/"engineer" ("MLOps", "AIOps", "MLEngineer"), so
+# "Retail", "Email", "HTML" or "Maintenance" don't count.
+_AI_FOCUS_RE = re.compile(
+    r"\b(?:ai|ml)(?=ops|engineer|[^a-z]|$)|machine learning|llm|genai|generative|gpt|agent|automation"
+)
+
+
 def has_ai_focus(title: str) -> bool:
     """Check if title suggests AI/ML focus."""
-    keywords = ["ai", "ml", "machine learning", "llm", "genai", "generative", "gpt", "agent", "automation"]
-    t = title.lower()
-    return any(kw in t for kw in keywords)
+    return _AI_FOCUS_RE.search(title.lower()) is not None
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp; memoized since the same strings recur across a board."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
 
 
 def compute_days_ago(posted: Optional[str]) -> Optional[int]:
     """Compute days since job was posted from ISO date string."""
     if not posted:
         return None
-    try:
-        posted_date = datetime.fromisoformat(posted.replace("Z", "+00:00"))
-        now = datetime.utcnow()
-        if posted_date.tzinfo is not None:
-            now = now.replace(tzinfo=posted_date.tzinfo)
-        delta = now - posted_date
-        return max(0, delta.days)
-    except (ValueError, TypeError):
+    posted_date = _parse_iso(posted)
+    if posted_date is None:
         return None
+    now = datetime.utcnow()
+    if posted_date.tzinfo is not None:
+        now = now.replace(tzinfo=posted_date.tzinfo)
+    delta = now - posted_date
+    return max(0, delta.days)
 
 
 def level_rank(level: str) -> int:
@@ -2,16 +2,28 @@
 
 import asyncio
 import json
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 # Connected clients
 _clients: set[WebSocket] = set()
 
+# Event loop the clients live on, captured when the first one connects
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Broadcasts within this window are coalesced into one send per distinct message
+BROADCAST_DEBOUNCE = 0.05  # seconds
+
+# Loop-thread only: messages waiting for the next flush (dict as ordered set)
+_pending: dict[str, None] = {}
+_flush_handle: Optional[asyncio.TimerHandle] = None
+
 
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint handler."""
+    global _loop
+    _loop = asyncio.get_running_loop()
     await websocket.accept()
     _clients.add(websocket)
     try:
@@ -26,27 +38,61 @@ def broadcast(event: str, data: dict[str, Any] | None = None):
     """
     Broadcast event to all connected clients.
 
-    Can be called from sync code - handles async internally.
+    Can be called from sync code (threadpool routes) or the event loop. The
+    message is queued on the clients' loop and sent after a short debounce,
+    so a burst of identical events (e.g. ten job patches) reaches each
+    client once.
     """
-    message = json.dumps({"event": event, "data": data or {}})
-
-    async def _send():
-        disconnected = []
-        for client in _clients:
-            try:
-                await client.send_text(message)
-            except Exception:
-                disconnected.append(client)
-        for client in disconnected:
-            _clients.discard(client)
+    loop = _loop
+    if loop is None or loop.is_closed() or not _clients:
+        return  # Nobody to notify
+    loop.call_soon_threadsafe(_enqueue, _encode(event, data))
 
-    # Try to get running loop, create one if needed
-    try:
-        loop = asyncio.get_running_loop()
-        loop.create_task(_send())
-    except RuntimeError:
-        # No running loop - run synchronously
-        asyncio.run(_send())
+
+# Payload-free events (jobs_updated, ...) always encode the same way
+_EMPTY_MESSAGES: dict[str, str] = {}
+
+
+def _encode(event: str, data: dict[str, Any] | None) -> str:
+    if data:
+        return json.dumps({"event": event, "data": data})
+    message = _EMPTY_MESSAGES.get(event)
+    if message is None:
+        message = _EMPTY_MESSAGES[event] = json.dumps({"event": event, "data": {}})
+    return message
+
+
+def _enqueue(message: str):
+    """Add a message to the pending set and arm the flush timer (loop thread)."""
+    global _flush_handle
+    _pending[message] = None
+    if _flush_handle is None:
+        _flush_handle = _loop.call_later(BROADCAST_DEBOUNCE, _flush)
+
+
+def _flush():
+    """Send everything queued during the debounce window (loop thread)."""
+    global _flush_handle
+    _flush_handle = None
+    messages = list(_pending)
+    _pending.clear()
+    _loop.create_task(_send(messages))
+
+
+async def _send_to(client: WebSocket, messages: list[str]):
+    for message in messages:
+        await client.send_text(message)
+
+
+async def _send(messages: list[str]):
+    # Send to all clients concurrently so one slow socket doesn't delay the rest
+    clients = list(_clients)
+    results = await asyncio.gather(
+        *(_send_to(client, messages) for client in clients), return_exceptions=True
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception):
+            _clients.discard(client)
 
 
 def broadcast_jobs_updated():
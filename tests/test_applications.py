@@ -1,17 +1,20 @@
 """Tests for applications data layer."""
 
+import json
 import shutil
 
 import pytest
 
 from server.applications import (
-    APPLICATIONS_DIR,
+    _DOCX_EXECUTOR,
     GapAnalysis,
     InterviewPrep,
     JobSummary,
     WhatToSayItem,
+    archive_application,
     create_application,
     delete_application,
+    export_document,
     get_application,
     list_applications,
     save_cv_tailored,
@@ -35,36 +38,31 @@ def test_job():
     )
 
 
-@pytest.fixture
-def cleanup_test_apps():
-    """Clean up test applications after tests."""
-    created_apps = []
-    yield created_apps
-    for app_id in created_apps:
-        app_dir = APPLICATIONS_DIR / app_id
-        if app_dir.exists():
-            shutil.rmtree(app_dir)
+@pytest.fixture(autouse=True)
+def apps_dir(tmp_path, monkeypatch):
+    """Keep test applications (and the summary index) out of the real directory."""
+    path = tmp_path / "applications"
+    path.mkdir()
+    monkeypatch.setattr("server.applications.APPLICATIONS_DIR", path)
+    return path
 
 
 class TestCreateApplication:
-    def test_creates_directory(self, test_job, cleanup_test_apps):
+    def test_creates_directory(self, test_job, apps_dir):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         assert app.application_id.endswith("-test-corp-senior-product-manager")
         assert app.status == "pending"
         assert app.job.job_id == "job_test123"
 
-        app_dir = APPLICATIONS_DIR / app.application_id
+        app_dir = apps_dir / app.application_id
         assert app_dir.exists()
         assert (app_dir / "metadata.json").exists()
 
-    def test_handles_duplicate_ids(self, test_job, cleanup_test_apps):
+    def test_handles_duplicate_ids(self, test_job):
         app1 = create_application(test_job)
-        cleanup_test_apps.append(app1.application_id)
 
         app2 = create_application(test_job)
-        cleanup_test_apps.append(app2.application_id)
 
         assert app1.application_id != app2.application_id
         assert app2.application_id.endswith("-1")
@@ -75,9 +73,8 @@ class TestGetApplication:
         result = get_application("nonexistent-app-id")
         assert result is None
 
-    def test_loads_full_application(self, test_job, cleanup_test_apps):
+    def test_loads_full_application(self, test_job):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         # Save some data
         save_jd(app.application_id, "# Job Description\n\nTest content")
@@ -95,9 +92,8 @@ class TestGetApplication:
 
 
 class TestListApplications:
-    def test_lists_all_applications(self, test_job, cleanup_test_apps):
+    def test_lists_all_applications(self, test_job):
         app1 = create_application(test_job)
-        cleanup_test_apps.append(app1.application_id)
 
         test_job2 = JobSummary(
             job_id="job_test456",
@@ -106,7 +102,6 @@ class TestListApplications:
             url="https://example.com/job/456",
         )
         app2 = create_application(test_job2)
-        cleanup_test_apps.append(app2.application_id)
 
         apps = list_applications()
         app_ids = [a.application_id for a in apps]
@@ -114,11 +109,33 @@ class TestListApplications:
         assert app1.application_id in app_ids
         assert app2.application_id in app_ids
 
+    def test_picks_up_directories_removed_outside_api(self, test_job, apps_dir):
+        app = create_application(test_job)
+        assert app.application_id in [a.application_id for a in list_applications()]
+
+        shutil.rmtree(apps_dir / app.application_id)
+
+        assert app.application_id not in [a.application_id for a in list_applications()]
+
+
+class TestArchiveApplication:
+    def test_archived_hidden_from_default_list(self, test_job):
+        app = create_application(test_job)
+
+        assert archive_application(app.application_id) is True
+
+        assert app.application_id not in [a.application_id for a in list_applications()]
+        archived = [a for a in list_applications(include_archived=True) if a.application_id == app.application_id]
+        assert archived[0].archived is True
+
+    def test_returns_false_for_nonexistent(self):
+        assert archive_application("nonexistent-app-id") is False
+
 
 class TestDeleteApplication:
-    def test_deletes_application(self, test_job, cleanup_test_apps):
+    def test_deletes_application(self, test_job, apps_dir):
         app = create_application(test_job)
-        app_dir = APPLICATIONS_DIR / app.application_id
+        app_dir = apps_dir / app.application_id
 
         assert app_dir.exists()
         result = delete_application(app.application_id)
@@ -131,17 +148,15 @@ class TestDeleteApplication:
 
 
 class TestUpdateStatus:
-    def test_updates_status(self, test_job, cleanup_test_apps):
+    def test_updates_status(self, test_job):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         update_application_status(app.application_id, "complete")
         loaded = get_application(app.application_id)
         assert loaded.status == "complete"
 
-    def test_updates_error(self, test_job, cleanup_test_apps):
+    def test_updates_error(self, test_job):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         update_application_status(app.application_id, "error", "Scraping failed")
         loaded = get_application(app.application_id)
@@ -149,17 +164,15 @@ class TestUpdateStatus:
 
 
 class TestSaveContent:
-    def test_save_jd(self, test_job, cleanup_test_apps):
+    def test_save_jd(self, test_job):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         save_jd(app.application_id, "# Test JD")
         loaded = get_application(app.application_id)
         assert loaded.jd == "# Test JD"
 
-    def test_save_interview_prep(self, test_job, cleanup_test_apps):
+    def test_save_interview_prep(self, test_job):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         prep = InterviewPrep(
             what_to_say=[WhatToSayItem(question="Tell me about AI work", answer="Shipped AI feature")],
@@ -172,9 +185,8 @@ class TestSaveContent:
         assert len(loaded.interview_prep.what_to_say) == 1
         assert loaded.interview_prep.questions_to_ask[0] == "What's the team size?"
 
-    def test_cv_versioning(self, test_job, cleanup_test_apps):
+    def test_cv_versioning(self, test_job, apps_dir):
         app = create_application(test_job)
-        cleanup_test_apps.append(app.application_id)
 
         # Save first version
         save_cv_tailored(app.application_id, "# CV v1")
@@ -186,6 +198,62 @@ class TestSaveContent:
         assert loaded.cv_tailored == "# CV v2"
 
         # Check versioned file exists
-        app_dir = APPLICATIONS_DIR / app.application_id
+        app_dir = apps_dir / app.application_id
         assert (app_dir / "cv-tailored.v1.md").exists()
         assert (app_dir / "cv-tailored.v1.md").read_text() == "# CV v1"
+
+    def test_cv_versions_tracked_in_metadata(self, test_job, apps_dir):
+        app = create_application(test_job)
+
+        for n in range(1, 4):
+            save_cv_tailored(app.application_id, f"# CV v{n}")
+
+        app_dir = apps_dir / app.application_id
+        assert (app_dir / "cv-tailored.v2.md").read_text() == "# CV v2"
+        metadata = json.loads((app_dir / "metadata.json").read_text())
+        assert metadata["versions"] == ["cv-tailored.v1.md", "cv-tailored.v2.md"]
+
+    def test_cv_docx_generated_in_background(self, test_job, apps_dir):
+        app = create_application(test_job)
+
+        assert save_cv_tailored(app.application_id, "# Jane Doe\n\n## Experience")
+
+        # Drain the single-worker queue so the DOCX job has finished
+        _DOCX_EXECUTOR.submit(lambda: None).result()
+        assert (apps_dir / app.application_id / "cv.docx").exists()
+
+    def test_metadata_written_atomically(self, test_job, apps_dir):
+        app = create_application(test_job)
+
+        update_application_status(app.application_id, "complete")
+
+        app_dir = apps_dir / app.application_id
+        assert not list(app_dir.glob("*.tmp"))
+        assert get_application(app.application_id).status == "complete"
+
+    def test_unchanged_cv_skips_docx_regeneration(self, test_job, apps_dir):
+        app = create_application(test_job)
+        docx_path = apps_dir / app.application_id / "cv.docx"
+
+        save_cv_tailored(app.application_id, "# Jane Doe")
+        _DOCX_EXECUTOR.submit(lambda: None).result()
+        first_mtime = docx_path.stat().st_mtime_ns
+
+        result = export_document(app.application_id, "cv")
+
+        assert result["status"] == "ok"
+        assert docx_path.stat().st_mtime_ns == first_mtime
+
+    def test_docx_render_keeps_updated_at(self, test_job, apps_dir):
+        app = create_application(test_job)
+        metadata_path = apps_dir / app.application_id / "metadata.json"
+        before = json.loads(metadata_path.read_text())
+        index_mtime = (apps_dir / "_index.json").stat().st_mtime_ns
+
+        save_cv_tailored(app.application_id, "# Jane Doe")
+        _DOCX_EXECUTOR.submit(lambda: None).result()
+
+        after = json.loads(metadata_path.read_text())
+        assert after["cv_docx_hash"]
+        assert after["updated_at"] == before["updated_at"]
+        assert (apps_dir / "_index.json").stat().st_mtime_ns == index_mtime
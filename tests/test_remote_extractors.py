@@ -1,12 +1,14 @@
 """Tests for remote extractor fetching and caching."""
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from scripts.research.remote import get_extractor_js, clear_cache, CACHE_DIR, CACHE_TTL
+from scripts.research.remote import _REFRESH_EXECUTOR, get_extractor_js, clear_cache, CACHE_DIR, CACHE_TTL
 
 
 @pytest.fixture
@@ -45,8 +47,8 @@ class TestGetExtractorJs:
         assert result == "() => { return {cached: true}; }"
         mock_get.assert_not_called()  # Should not hit network
 
-    def test_refetches_when_cache_stale(self, temp_cache_dir):
-        """Refetches from GitHub when cache is stale (> 1 hour)."""
+    def test_serves_stale_cache_while_refreshing(self, temp_cache_dir):
+        """Returns stale cache at once and refreshes it in the background."""
         cache_file = temp_cache_dir / "glassdoor.js"
         temp_cache_dir.mkdir(parents=True, exist_ok=True)
         cache_file.write_text("() => { return {old: true}; }")
@@ -60,10 +62,15 @@ class TestGetExtractorJs:
         mock_response.text = "() => { return {new: true}; }"
         mock_response.raise_for_status = MagicMock()
 
-        with patch("scripts.research.remote.requests.get", return_value=mock_response):
+        with patch("scripts.research.remote.requests.get", return_value=mock_response) as mock_get:
             result = get_extractor_js("glassdoor")
+            # Drain the single-worker queue so the refresh has finished
+            _REFRESH_EXECUTOR.submit(lambda: None).result()
 
-        assert result == "() => { return {new: true}; }"
+        assert result == "() => { return {old: true}; }"
+        mock_get.assert_called_once()
+        assert cache_file.read_text() == "() => { return {new: true}; }"
+        assert get_extractor_js("glassdoor") == "() => { return {new: true}; }"
 
     def test_falls_back_to_stale_cache_on_network_error(self, temp_cache_dir):
         """Falls back to stale cache when network fails."""
@@ -78,8 +85,45 @@ class TestGetExtractorJs:
 
         with patch("scripts.research.remote.requests.get", side_effect=Exception("Network error")):
             result = get_extractor_js("glassdoor")
+            _REFRESH_EXECUTOR.submit(lambda: None).result()
 
         assert result == "() => { return {stale: true}; }"
+        assert cache_file.read_text() == "() => { return {stale: true}; }"
+
+    def test_repeat_calls_served_from_memory(self, temp_cache_dir):
+        """A fresh extractor is kept in memory until the cache is cleared."""
+        temp_cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = temp_cache_dir / "glassdoor.js"
+        cache_file.write_text("() => { return {v: 1}; }")
+
+        assert get_extractor_js("glassdoor") == "() => { return {v: 1}; }"
+        cache_file.write_text("() => { return {v: 2}; }")
+        assert get_extractor_js("glassdoor") == "() => { return {v: 1}; }"
+
+        clear_cache("glassdoor")
+        cache_file.write_text("() => { return {v: 3}; }")
+        assert get_extractor_js("glassdoor") == "() => { return {v: 3}; }"
+
+    def test_concurrent_cold_calls_fetch_once(self, temp_cache_dir):
+        """Concurrent callers on an empty cache share one network fetch."""
+        barrier = threading.Barrier(10)
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            response = MagicMock()
+            response.text = "() => { return {}; }"
+            return response
+
+        def call():
+            barrier.wait()
+            return get_extractor_js("glassdoor")
+
+        with patch("scripts.research.remote.requests.get", side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                results = list(pool.map(lambda _: call(), range(10)))
+
+        assert results == ["() => { return {}; }"] * 10
+        assert mock_get.call_count == 1
 
     def test_raises_when_no_cache_and_network_fails(self, temp_cache_dir):
         """Raises RuntimeError when both cache and network unavailable."""
@@ -5,20 +5,34 @@ from unittest.mock import patch
 
 import pytest
 
+from server import data as data_module
 from server.data import (
     Job,
     SearchResults,
     SearchParams,
+    get_results,
+    batch_writes,
     Selections,
     remove_jobs,
     remove_deep_dives,
     update_job,
+    update_jobs,
     get_selections,
+    select_jobs,
+    deselect_jobs,
     get_deep_dives,
+    get_deep_dives_json,
     save_deep_dive,
+    get_deep_dive_by_id,
     DeepDive,
     DeepDives,
     JobNotFoundError,
+    normalize_company_name,
+    get_existing_job_keys,
+    title_company_key,
+    get_job_by_id,
+    delete_deep_dives,
+    archive_deep_dives,
 )
 
 
@@ -176,6 +190,63 @@ class TestUpdateJob:
         assert updated.job_id == "job_001"  # ID unchanged
         assert updated.title == "Updated"
 
+    def test_update_jobs_single_write(self, temp_data_dir):
+        """Bulk update applies every found job and skips unknown IDs."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[
+                Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test"),
+                Job(job_id="job_002", title="Job 2", company="Co2", url="http://2", source="test"),
+            ],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file), \
+                patch("server.data._write_model", wraps=data_module._write_model) as write:
+            updated = update_jobs({
+                "job_001": {"archived": True},
+                "job_002": {"archived": True, "title": "Renamed"},
+                "missing": {"archived": True},
+            })
+
+        assert set(updated) == {"job_001", "job_002"}
+        assert write.call_count == 1
+        data = json.loads(results_file.read_text())
+        assert [j["archived"] for j in data["jobs"]] == [True, True]
+        assert data["jobs"][1]["title"] == "Renamed"
+
+
+class TestLegacyWorkflowValues:
+    """Stored workflow values outside the request vocabularies are kept as-is."""
+
+    def test_unknown_values_survive_unrelated_writes(self, temp_data_dir):
+        tmp_path, results_file, deep_dives_file = temp_data_dir
+        job = {"url": "http://1", "source": "test", "title": "PM", "company": "Co"}
+        results_file.write_text(json.dumps({
+            "search_params": {"query": "test"},
+            "jobs": [
+                job | {"job_id": "job_001", "verdict": "Strong yes", "priority": "urgent"},
+                job | {"job_id": "job_002"},
+            ],
+        }))
+        deep_dives_file.write_text(json.dumps({"deep_dives": [
+            {"job_id": "job_001", "status": "in_progress"},
+            {"job_id": "job_002"},
+        ]}))
+
+        with patch("server.data.RESULTS_FILE", results_file), \
+                patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+            assert get_results().jobs[0].verdict == "Strong yes"
+            update_job("job_002", {"title": "Renamed"})
+            archive_deep_dives(["job_002"])
+
+        saved_job = json.loads(results_file.read_text())["jobs"][0]
+        assert saved_job["verdict"] == "Strong yes"
+        assert saved_job["priority"] == "urgent"
+        assert json.loads(deep_dives_file.read_text())["deep_dives"][0]["status"] == "in_progress"
+
 
 class TestRemoveDeepDives:
     """Tests for remove_deep_dives function."""
@@ -212,6 +283,28 @@ class TestRemoveDeepDives:
         assert data["deep_dives"][0]["job_id"] == "job_002"
 
 
+    def test_delete_deep_dives_bulk(self, temp_data_dir):
+        """Bulk delete removes found dives in one write and reports the rest."""
+        tmp_path, results_file, deep_dives_file = temp_data_dir
+
+        dives = DeepDives(
+            deep_dives=[
+                DeepDive(job_id="job_001", status="complete"),
+                DeepDive(job_id="job_002", status="complete"),
+                DeepDive(job_id="job_003", status="complete"),
+            ]
+        )
+        deep_dives_file.write_text(json.dumps(dives.model_dump()))
+
+        with patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+            deleted, not_found = delete_deep_dives(["job_001", "job_003", "job_999"])
+
+        assert deleted == 2
+        assert not_found == ["job_999"]
+        data = json.loads(deep_dives_file.read_text())
+        assert [d["job_id"] for d in data["deep_dives"]] == ["job_002"]
+
+
 class TestGetDeepDives:
     """Tests for get_deep_dives - pure read, no pruning."""
 
@@ -247,6 +340,74 @@ class TestGetDeepDives:
         data = json.loads(deep_dives_file.read_text())
         assert len(data["deep_dives"]) == 2
 
+    def test_legacy_research_lists_coerced(self, temp_data_dir):
+        """Legacy None / plain-string research fields load as empty lists."""
+        tmp_path, results_file, deep_dives_file = temp_data_dir
+        deep_dives_file.write_text(json.dumps({"deep_dives": [{
+            "job_id": "job_001",
+            "research": {
+                "sentiment": {"employee": None, "customer": "mostly positive"},
+                "context": {"market": None},
+            },
+            "research_notes": {"employee": None, "company": "n/a"},
+        }]}))
+
+        with patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+            dive = get_deep_dives().deep_dives[0]
+
+        assert dive.research.sentiment.employee == []
+        assert dive.research.sentiment.customer == []
+        assert dive.research.context.market == []
+        assert dive.research_notes.employee == []
+        assert dive.research_notes.company == []
+
+    def test_legacy_out_of_range_values_kept(self, temp_data_dir):
+        """Values stored before requests were range-checked load and survive writes."""
+        tmp_path, results_file, deep_dives_file = temp_data_dir
+        job = {"url": "http://1", "source": "test", "title": "PM", "company": "Co"}
+        results_file.write_text(json.dumps({
+            "search_params": {"query": "test"},
+            "jobs": [job | {"job_id": "job_001", "days_ago": -2}, job | {"job_id": "job_002"}],
+        }))
+        deep_dives_file.write_text(json.dumps({"deep_dives": [
+            {"job_id": "job_001", "conclusions": {"fit_score": 75}},
+            {"job_id": "job_002", "conclusions": {"fit_score": 7}},
+        ]}))
+
+        with patch("server.data.RESULTS_FILE", results_file), \
+                patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+            assert [d.conclusions.fit_score for d in get_deep_dives().deep_dives] == [75, 7]
+            assert get_results().jobs[0].days_ago == -2
+            archive_deep_dives(["job_002"])
+            update_job("job_002", {"title": "Renamed"})
+
+        assert json.loads(deep_dives_file.read_text())["deep_dives"][0]["conclusions"]["fit_score"] == 75
+        assert json.loads(results_file.read_text())["jobs"][0]["days_ago"] == -2
+
+    def test_json_body_cached_until_file_changes(self, temp_data_dir):
+        """Serialized deep dives are reused per file version and skip archived ones by default."""
+        tmp_path, results_file, deep_dives_file = temp_data_dir
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test")],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+        dives = DeepDives(deep_dives=[
+            DeepDive(job_id="job_001", status="complete"),
+            DeepDive(job_id="job_002", status="complete", archived=True),
+        ])
+        deep_dives_file.write_text(json.dumps(dives.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file), \
+                patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+            body = get_deep_dives_json()
+            assert [d["job_id"] for d in json.loads(body)["deep_dives"]] == ["job_001"]
+            assert len(json.loads(get_deep_dives_json(include_archived=True))["deep_dives"]) == 2
+            assert get_deep_dives_json() is body
+
+            save_deep_dive(DeepDive(job_id="job_001", status="pending"))
+            assert json.loads(get_deep_dives_json())["deep_dives"][0]["status"] == "pending"
+
 
 class TestSaveDeepDive:
     """Tests for save_deep_dive with job validation."""
@@ -273,6 +434,27 @@ class TestSaveDeepDive:
         assert len(data["deep_dives"]) == 1
         assert data["deep_dives"][0]["job_id"] == "job_001"
 
+    def test_resave_replaces_existing_deep_dive(self, temp_data_dir):
+        """Saving again for the same job replaces the entry instead of appending."""
+        tmp_path, results_file, deep_dives_file = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test")],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+        deep_dives_file.write_text(json.dumps({"deep_dives": []}))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            with patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+                save_deep_dive(DeepDive(job_id="job_001", status="pending"))
+                assert get_deep_dive_by_id("job_001").status == "pending"
+                save_deep_dive(DeepDive(job_id="job_001", status="complete"))
+                assert get_deep_dive_by_id("job_001").status == "complete"
+
+        data = json.loads(deep_dives_file.read_text())
+        assert len(data["deep_dives"]) == 1
+
     def test_save_deep_dive_for_nonexistent_job_raises(self, temp_data_dir):
         """Saving deep dive for non-existent job raises JobNotFoundError."""
         tmp_path, results_file, deep_dives_file = temp_data_dir
@@ -360,3 +542,256 @@ class TestGetSelections:
                 result = get_selections()
 
         assert result.selected_ids == ["job_001"]
+
+    def test_legacy_selected_ids_become_user_selections(self):
+        """Legacy IDs not already attributed are folded in as user selections."""
+        selections = Selections.model_validate({
+            "selections": [{"job_id": "job_001", "source": "claude"}],
+            "selected_ids": ["job_001", "job_002"],
+        })
+
+        assert [(s.job_id, s.source) for s in selections.selections] == [
+            ("job_001", "claude"),
+            ("job_002", "user"),
+        ]
+        assert selections.selected_ids == ["job_001", "job_002"]
+        assert selections.model_dump()["selected_ids"] == ["job_001", "job_002"]
+
+
+class TestModelCache:
+    """Tests for the mtime-keyed model cache behind the getters."""
+
+    def test_reuses_model_until_file_changes(self, temp_data_dir):
+        """Repeated reads share one model; an external write is picked up."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test")],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            first = get_results()
+            assert get_results() is first
+
+            results.jobs.append(Job(job_id="job_002", title="Job 2", company="Co2", url="http://2", source="test"))
+            results_file.write_text(json.dumps(results.model_dump(), indent=2))
+            reloaded = get_results()
+
+        assert reloaded is not first
+        assert [j.job_id for j in reloaded.jobs] == ["job_001", "job_002"]
+
+    def test_writes_refresh_cache(self, temp_data_dir):
+        """Reads after a save see the saved data without re-parsing."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[Job(job_id="job_001", title="Old Title", company="Co1", url="http://1", source="test")],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            update_job("job_001", {"title": "New Title"})
+            assert get_results().jobs[0].title == "New Title"
+
+    def test_writes_omit_none_fields(self, temp_data_dir):
+        """Saved files drop None fields and still load back identically."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test")],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            update_job("job_001", {"priority": "high"})
+            saved = json.loads(results_file.read_text())
+            assert "salary" not in saved["jobs"][0]
+            assert saved["jobs"][0]["priority"] == "high"
+            assert SearchResults.model_validate(saved) == get_results()
+
+    def test_existing_job_keys_follow_file_version(self, temp_data_dir):
+        """Dedupe keys are reused until the board changes."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[Job(job_id="job_001", title=" PM ", company="Acme", url="http://1", source="test")],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            job_ids, title_keys = get_existing_job_keys()
+            assert job_ids == {"job_001"}
+            assert title_keys == {"pm:acme"}
+            assert get_existing_job_keys()[1] is title_keys
+
+            update_job("job_001", {"company": "Globex"})
+            assert get_existing_job_keys()[1] == {"pm:globex"}
+
+    def test_get_job_by_id(self, temp_data_dir):
+        """Single-job lookup goes through the index and sees updates."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[
+                Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test"),
+                Job(job_id="job_002", title="Job 2", company="Co2", url="http://2", source="test"),
+            ],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            assert get_job_by_id("job_002").title == "Job 2"
+            assert get_job_by_id("missing") is None
+            update_job("job_002", {"title": "Renamed"})
+            assert get_job_by_id("job_002").title == "Renamed"
+
+    def test_failed_writes_leave_cache_matching_disk(self, temp_data_dir):
+        """A validation or I/O failure mid-update doesn't leak into later reads."""
+        tmp_path, results_file, _ = temp_data_dir
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[
+                Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test"),
+                Job(job_id="job_002", title="Job 2", company="Co2", url="http://2", source="test"),
+            ],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+        def on_disk():
+            return SearchResults.model_validate_json(results_file.read_bytes())
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            cached = get_results()
+
+            # Second job fails validation after the first was already merged
+            with pytest.raises(ValueError):
+                update_jobs({"job_001": {"title": "Changed"}, "job_002": {"archived": "maybe"}})
+            assert get_results() is cached
+            assert get_results() == on_disk()
+
+            with patch("server.data._atomic_write_bytes", side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    update_job("job_001", {"title": "Changed"})
+            assert get_results() == on_disk()
+            assert get_results().jobs[0].title == "Job 1"
+
+    @pytest.mark.parametrize("content", ["{not json", "[1, 2]"])
+    def test_unreadable_file_falls_back_to_default(self, temp_data_dir, content):
+        """Malformed or non-object JSON loads as the default model."""
+        tmp_path, _, deep_dives_file = temp_data_dir
+        deep_dives_file.write_text(content)
+
+        with patch("server.data.DEEP_DIVES_FILE", deep_dives_file):
+            assert get_deep_dives().deep_dives == []
+
+
+class TestBatchWrites:
+    """Tests for batch_writes write coalescing."""
+
+    def _write_results(self, results_file):
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[
+                Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test"),
+                Job(job_id="job_002", title="Job 2", company="Co2", url="http://2", source="test"),
+            ],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+
+    def test_defers_writes_until_exit(self, temp_data_dir):
+        """Updates inside the block are visible to reads but written once at exit."""
+        tmp_path, results_file, _ = temp_data_dir
+        self._write_results(results_file)
+        before = results_file.read_text()
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            with batch_writes():
+                update_job("job_001", {"sort_order": 0})
+                update_job("job_002", {"sort_order": 1})
+                assert results_file.read_text() == before
+                assert get_results().jobs[1].sort_order == 1
+
+        data = json.loads(results_file.read_text())
+        assert [j["sort_order"] for j in data["jobs"]] == [0, 1]
+
+    def test_discards_writes_on_error(self, temp_data_dir):
+        """An exception inside the block leaves the file and cache untouched."""
+        tmp_path, results_file, _ = temp_data_dir
+        self._write_results(results_file)
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            with pytest.raises(RuntimeError):
+                with batch_writes():
+                    update_job("job_001", {"title": "Changed"})
+                    raise RuntimeError("boom")
+
+            assert get_results().jobs[0].title == "Job 1"
+
+
+class TestDeselectJobs:
+    """Tests for deselect_jobs."""
+
+    def test_removes_from_both_selection_fields(self, temp_data_dir):
+        """Deselected IDs leave both selections and legacy selected_ids."""
+        tmp_path, results_file, _ = temp_data_dir
+        selections_file = tmp_path / "selections.json"
+
+        results = SearchResults(
+            search_params=SearchParams(query="test"),
+            jobs=[
+                Job(job_id="job_001", title="Job 1", company="Co1", url="http://1", source="test"),
+                Job(job_id="job_002", title="Job 2", company="Co2", url="http://2", source="test"),
+            ],
+        )
+        results_file.write_text(json.dumps(results.model_dump()))
+        selections_file.write_text(json.dumps({"selections": [], "selected_ids": []}))
+
+        with patch("server.data.RESULTS_FILE", results_file):
+            with patch("server.data.SELECTIONS_FILE", selections_file):
+                select_jobs(["job_001", "job_002"], source="user")
+                result = deselect_jobs(["job_001", "job_999"])
+
+        assert result == {"status": "ok", "removed": 1}
+        data = json.loads(selections_file.read_text())
+        assert [s["job_id"] for s in data["selections"]] == ["job_002"]
+        assert data["selected_ids"] == ["job_002"]
+
+
+class TestNormalizeCompanyName:
+    """Tests for normalize_company_name suffix stripping."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Acme Inc.", "acme"),
+        ("  Acme LLC ", "acme"),
+        ("acme.ai", "acme"),
+        ("Acme.io Ltd", "acme"),
+        ("Acme Inc Inc", "acme inc"),
+        ("Incubator", "incubator"),
+    ])
+    def test_strips_known_suffixes(self, name, expected):
+        assert normalize_company_name(name) == expected
+
+
+class TestTitleCompanyKey:
+    """Tests for the dedupe key used by push/ingest/search."""
+
+    @pytest.mark.parametrize("a,b", [
+        (("Senior PM", "Acme"), ("  senior  pm ", "ACME")),
+        (("Sr. PM – AI", "Acme, Inc."), ("sr pm - ai", "acme inc")),
+        (("Straße PM", "Acme"), ("STRASSE PM", "acme")),
+    ])
+    def test_equivalent_postings_share_key(self, a, b):
+        assert title_company_key(*a) == title_company_key(*b)
+
+    def test_distinct_titles_differ(self):
+        assert title_company_key("PM", "Acme") != title_company_key("Senior PM", "Acme")
+
+    def test_language_symbols_kept(self):
+        assert title_company_key("C++ Engineer", "Acme") != title_company_key("C# Engineer", "Acme")
@@ -0,0 +1,66 @@
+"""Tests for shared job-processing utilities."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from server.utils import compute_days_ago, has_ai_focus, normalize_job_id
+
+
+class TestHasAiFocus:
+    """Tests for has_ai_focus title matching."""
+
+    @pytest.mark.parametrize("title", [
+        "AI Product Manager",
+        "PM, AI/ML Platform",
+        "GenAI Product Lead",
+        "Senior PM - LLMs",
+        "Product Manager, Agentic Workflows",
+        "Machine Learning PM",
+        "MLOps Engineer",
+        "AIOps Lead",
+        "Senior MLEngineer",
+        "PM (AI)",
+    ])
+    def test_ai_titles(self, title):
+        assert has_ai_focus(title)
+
+    @pytest.mark.parametrize("title", [
+        "Retail Product Manager",
+        "Email Marketing Manager",
+        "HTML Developer",
+        "Maintenance Lead",
+    ])
+    def test_embedded_ai_ml_letters_ignored(self, title):
+        assert not has_ai_focus(title)
+
+
+class TestComputeDaysAgo:
+    """Tests for compute_days_ago date parsing."""
+
+    def test_naive_and_utc_timestamps(self):
+        posted = (datetime.utcnow() - timedelta(days=3, hours=1)).isoformat()
+        assert compute_days_ago(posted) == 3
+        assert compute_days_ago(posted + "Z") == 3
+
+    @pytest.mark.parametrize("posted", [None, "", "not a date"])
+    def test_missing_or_invalid(self, posted):
+        assert compute_days_ago(posted) is None
+
+    def test_future_dates_clamp_to_zero(self):
+        assert compute_days_ago((datetime.utcnow() + timedelta(days=2)).isoformat()) == 0
+
+
+class TestNormalizeJobId:
+    """Tests for normalize_job_id short-ID expansion."""
+
+    @pytest.mark.parametrize("job_id,expected", [
+        ("job_li_123", "job_li_123"),
+        ("li_123", "job_li_123"),
+        ("sj_9", "job_sj_9"),
+        ("123", "job_li_123"),
+        ("custom", "custom"),
+        ("", ""),
+    ])
+    def test_expands_short_ids(self, job_id, expected):
+        assert normalize_job_id(job_id) == expected